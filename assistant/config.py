@@ -9,24 +9,34 @@ LOCAL_CONFIG_FILE = ASSISTANT_DIR / "config.local.yaml"
 
 _config: dict = {}
 _loaded = False
+_loaded_from: Path | None = None  # File the cached _config came from
+_config_file: Path | None = None  # Override set by use_file()
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-def load() -> dict:
-    """Load config.local.yaml. Safe to call multiple times (cached)."""
-    global _config, _loaded
-    if _loaded:
+def load(path: Path | None = None) -> dict:
+    """Load config.local.yaml (or `path`). Safe to call multiple times (cached).
+
+    The cache is keyed on the file: passing a `path` other than the one
+    already loaded re-reads from that path.
+    """
+    global _config, _loaded, _loaded_from
+    config_file = path or _config_file or LOCAL_CONFIG_FILE
+    if _loaded and (path is None or path == _loaded_from):
         return _config
 
-    if not LOCAL_CONFIG_FILE.exists():
+    if not config_file.exists():
         raise FileNotFoundError(
-            f"Required config file not found: {LOCAL_CONFIG_FILE}\n"
+            f"Required config file not found: {config_file}\n"
             f"Copy config.example.yaml to config.local.yaml and fill in your values."
         )
 
-    with open(LOCAL_CONFIG_FILE) as f:
-        _config = yaml.safe_load(f) or {}
+    # One read of the raw bytes; the loader detects the encoding itself
+    _config = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER) or {}
 
     _loaded = True
+    _loaded_from = config_file
     return _config
 
 
@@ -54,6 +64,14 @@ def require(dotpath: str) -> Any:
     return value
 
 
+def use_file(path: Path) -> dict:
+    """Load config from `path` instead of config.local.yaml (useful for tests)."""
+    global _config_file, _loaded
+    _config_file = path
+    _loaded = False
+    return load()
+
+
 def reload() -> dict:
     """Force reload from disk (useful for tests)."""
     global _loaded
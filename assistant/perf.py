@@ -26,114 +26,273 @@ Usage:
     async def get_response():
         ...
 
-Logs are written to ~/dispatch/logs/perf-YYYY-MM-DD.jsonl
+Logs are written to ~/dispatch/logs/perf-YYYY-MM-DD.jsonl; a day's log that
+passes MAX_FILE_SIZE_MB is rotated to perf-YYYY-MM-DD.N.jsonl.
 """
 
+import atexit
+import copy
 import inspect
+import itertools
 import json
+import os
 import sys
 import time
-from contextlib import contextmanager
-from datetime import datetime
-from functools import wraps
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
+# orjson is optional: a C serializer several times faster than json.dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 PERF_DIR = Path.home() / "dispatch" / "logs"
 SCHEMA_VERSION = 1
-MAX_FILE_SIZE_MB = 100
+MAX_FILE_SIZE_MB = 100  # rotate today's log to perf-YYYY-MM-DD.N.jsonl past this
+RETENTION_DAYS = 30  # rotation also prunes perf logs older than this
+# PERF_ENABLED=0 turns every recording function into a no-op (read at import)
+PERF_ENABLED = os.environ.get("PERF_ENABLED", "1").lower() not in ("0", "false", "no")
 
-# Sampling state for high-frequency metrics
-_sample_counters: dict[str, int] = {}
+# Sampling state for high-frequency metrics: one C-level call counter per
+# metric, so the sampling check is a single next() with no Python-level update
+_sample_counters: defaultdict[str, itertools.count] = defaultdict(itertools.count)
 
 # Buffered writer: accumulate metrics in memory and flush periodically
-# to avoid opening a file for every single metric.
+# to avoid opening a file for every single metric. One daemon thread does
+# all the serializing and writing; it sleeps until the buffer is non-empty,
+# then lets a batch accumulate for up to _FLUSH_INTERVAL (or until
+# _FLUSH_BATCH entries), so callers only pay for a list append.
 import threading
 
-_buffer: list[str] = []
+# Buffered entries are (ts, metric, value, labels) tuples
+_SCALAR_TYPES = (str, int, float, bool, type(None))  # label values queued as-is
+_buffer: list[tuple[str, str, Any, dict[str, Any]]] = []
 _buffer_lock = threading.Lock()
-_flush_timer: threading.Timer | None = None
+_buffer_ready = threading.Condition(_buffer_lock)
+_writer_thread: threading.Thread | None = None
 _FLUSH_INTERVAL = 2.0  # seconds
-_current_fh: Any = None
+_FLUSH_BATCH = 256  # lines; flush early once this many are buffered
+_current_fd: int | None = None  # O_APPEND fd for today's log
+_current_path: Path | None = None
 _current_date: str = ""
-_size_exceeded: bool = False
-
-
-def _get_file_handle():
-    """Get or create the file handle for today's perf log."""
-    global _current_fh, _current_date, _size_exceeded
-    today = f"{datetime.now():%Y-%m-%d}"
-    if _current_date != today:
-        # Day rolled over, close old handle
-        if _current_fh is not None:
-            try:
-                _current_fh.close()
-            except Exception:
-                pass
-        _current_fh = None
-        _current_date = today
-        _size_exceeded = False
-
-    if _size_exceeded:
-        return None
-
-    if _current_fh is None:
-        PERF_DIR.mkdir(parents=True, exist_ok=True)
-        path = PERF_DIR / f"perf-{today}.jsonl"
-        if path.exists() and path.stat().st_size > MAX_FILE_SIZE_MB * 1024 * 1024:
-            _size_exceeded = True
-            print(f"[perf] WARNING: {path} exceeds {MAX_FILE_SIZE_MB}MB, skipping", file=sys.stderr)
-            return None
-        _current_fh = open(path, "a")
-
-    return _current_fh
+_rollover_at: float = 0.0  # epoch seconds of the next local midnight
+_dir_checked: Path | None = None  # PERF_DIR value last known to exist
+
+
+def _get_file_handle() -> int:
+    """Get or open the O_APPEND file descriptor for today's perf log.
+
+    The date string is only recomputed once the clock passes midnight.
+    """
+    global _current_fd, _current_path, _current_date, _rollover_at, _dir_checked
+    now = time.time()
+    if now >= _rollover_at:
+        today_dt = datetime.fromtimestamp(now)
+        _rollover_at = datetime.combine(today_dt.date() + timedelta(days=1), dt_time.min).timestamp()
+        today = f"{today_dt:%Y-%m-%d}"
+        if _current_date != today:
+            # Day rolled over, close old descriptor
+            _close_fd()
+            _current_date = today
+
+    if _current_fd is None:
+        path = PERF_DIR / f"perf-{_current_date}.jsonl"
+        if _dir_checked is not PERF_DIR:
+            PERF_DIR.mkdir(parents=True, exist_ok=True)
+            _dir_checked = PERF_DIR
+        try:
+            _current_fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except FileNotFoundError:
+            _dir_checked = None  # directory removed since it was checked
+            raise
+        _current_path = path
+        if os.fstat(_current_fd).st_size > MAX_FILE_SIZE_MB * 1024 * 1024:
+            _rotate(path)
+            return _get_file_handle()
+
+    return _current_fd
+
+
+def _close_fd() -> None:
+    """Close today's log descriptor, if open."""
+    global _current_fd, _current_path
+    if _current_fd is not None:
+        try:
+            os.close(_current_fd)
+        except OSError:
+            pass
+    _current_fd = None
+    _current_path = None
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write until all of data is written (a write may be partial)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _rotate(path: Path) -> None:
+    """Move a full log aside as perf-YYYY-MM-DD.N.jsonl; the next write starts a fresh file."""
+    _close_fd()
+    n = 1
+    while (rotated := path.with_suffix(f".{n}.jsonl")).exists():
+        n += 1
+    os.rename(path, rotated)
+    threading.Thread(target=_prune_old_logs, args=(PERF_DIR,), name="perf-prune", daemon=True).start()
+
+
+def _prune_old_logs(perf_dir: Path) -> None:
+    """Delete perf logs (including rotated segments) older than RETENTION_DAYS."""
+    cutoff = time.time() - RETENTION_DAYS * 86400
+    for path in perf_dir.glob("perf-*.jsonl"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
 
 
 def _flush_buffer():
     """Flush buffered metrics to disk.
 
     Both buffer drain and file handle access are protected by _buffer_lock
-    to prevent race conditions on day rollover (Timer thread vs main thread).
+    to prevent race conditions on day rollover (writer thread vs main thread).
     """
-    global _flush_timer
     with _buffer_lock:
         if not _buffer:
-            _flush_timer = None
             return
-        lines = _buffer[:]
+        entries = _buffer[:]
         _buffer.clear()
-        _flush_timer = None
 
-        # File handle access inside the lock to prevent concurrent
-        # day-rollover from Timer thread and flush_metrics() caller
+        # File descriptor access inside the lock to prevent concurrent
+        # day-rollover from the writer thread and flush_metrics() caller.
+        # The fd is O_APPEND, so each os.write lands atomically at the end
+        # of the file with no userspace buffering to flush. dispatch-api's
+        # log_perf appends single lines to the same file (also O_APPEND, one
+        # write per line), so the two processes interleave whole writes;
+        # a batch is only split if the kernel returns a short write.
         try:
-            fh = _get_file_handle()
-            if fh:
-                fh.write("".join(lines))
-                fh.flush()
+            fd = _get_file_handle()
+            data = b"".join(_encode_entries(entries))
+            _write_all(fd, data)
+            # dispatch-api appends to the same file, so its size is read
+            # back from the fd rather than counted from our own writes
+            if os.fstat(fd).st_size > MAX_FILE_SIZE_MB * 1024 * 1024:
+                _rotate(_current_path)
         except Exception as e:
             print(f"[perf] WARNING: failed to flush metrics: {e}", file=sys.stderr)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize one JSON value."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Every line starts the same way; the metric and label parts repeat across
+# entries, so they are serialized once and cached as bytes.
+_ENTRY_PREFIX = b'{"v":%d,"ts":"' % SCHEMA_VERSION
+
+
+@lru_cache(maxsize=1024)
+def _metric_part(metric: str) -> bytes:
+    """The '","metric":...,"value":' span of a line."""
+    return b'","metric":' + _dumps(metric) + b',"value":'
+
+
+def _encode_labels(labels: dict[str, Any]) -> bytes:
+    """Labels as the closing span of a line: ',"k":v,...}' plus newline."""
+    if not labels:
+        return b"}\n"
+    return b"," + _dumps(labels)[1:] + b"\n"
+
+
+@lru_cache(maxsize=1024)
+def _cached_labels(items: tuple) -> bytes:
+    """_encode_labels for hashable label sets such as component="daemon".
+
+    items are (key, type, value) triples: True, 1 and 1.0 hash and compare
+    equal, so without the type they would share one cached encoding.
+    """
+    return _encode_labels({k: v for k, _, v in items})
+
+
+def _encode_entry(ts: str, metric: str, value: Any, labels: dict[str, Any]) -> bytes:
+    """Serialize one entry as a newline-terminated JSONL line."""
+    try:
+        tail = _cached_labels(tuple((k, type(v), v) for k, v in labels.items()))
+    except TypeError:
+        # Unhashable label values (e.g. tool input dicts) are encoded each time
+        tail = _encode_labels(labels)
+    return _ENTRY_PREFIX + ts.encode() + _metric_part(metric) + _dumps(value) + tail
+
+
+def _encode_entries(entries: list[tuple[str, str, Any, dict[str, Any]]]):
+    """Yield encoded lines, dropping (with a warning) any that won't serialize."""
+    for entry in entries:
+        try:
+            yield _encode_entry(*entry)
+        except Exception as e:
+            print(f"[perf] WARNING: failed to log metric: {e}", file=sys.stderr)
+
+
+def _writer_loop():
+    """Writer thread body: wait for metrics, let a batch build up, flush it."""
+    while True:
+        with _buffer_ready:
+            while not _buffer:
+                _buffer_ready.wait()
+            _buffer_ready.wait_for(lambda: len(_buffer) >= _FLUSH_BATCH, timeout=_FLUSH_INTERVAL)
+        _flush_buffer()
+
+
+# (epoch ms, formatted ts) of the last timestamp; swapped as one tuple so
+# concurrent callers never see a mismatched pair
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Local ISO timestamp at millisecond precision, formatted once per ms."""
+    global _ts_cache
+    ms = time.time_ns() // 1_000_000
+    cached_ms, ts = _ts_cache
+    if ms != cached_ms:
+        ts = datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds")
+        _ts_cache = (ms, ts)
+    return ts
+
+
+def _wake_writer() -> None:
+    """Start the writer thread if needed and wake it. Call with _buffer_lock held."""
+    global _writer_thread
+    # Only wake for the first item of a batch and for a full one
+    if len(_buffer) == 1 or len(_buffer) >= _FLUSH_BATCH:
+        _buffer_ready.notify()
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, name="perf-writer", daemon=True)
+        _writer_thread.start()
+
+
 def _log_metric(metric: str, value: float, **labels: Any) -> None:
     """Buffer metric for periodic flush. Never raises."""
-    global _flush_timer
     try:
-        entry = {
-            "v": SCHEMA_VERSION,
-            "ts": datetime.now().isoformat(),
-            "metric": metric,
-            "value": value,
-            **labels,
-        }
-        line = json.dumps(entry) + "\n"
+        # Entries are serialized later on the writer thread, so nested label
+        # values the caller still owns (e.g. tool input dicts) are copied now
+        for key, label in labels.items():
+            if not isinstance(label, _SCALAR_TYPES):
+                labels[key] = copy.deepcopy(label)
+        entry = (_now_iso(), metric, value, labels)
         with _buffer_lock:
-            _buffer.append(line)
-            # Schedule a flush if none pending
-            if _flush_timer is None:
-                _flush_timer = threading.Timer(_FLUSH_INTERVAL, _flush_buffer)
-                _flush_timer.daemon = True
-                _flush_timer.start()
+            _buffer.append(entry)
+            _wake_writer()
     except Exception as e:
         print(f"[perf] WARNING: failed to log metric: {e}", file=sys.stderr)
 
@@ -143,28 +302,27 @@ def flush_metrics():
 
     Call this before reading perf logs in tests, or during shutdown.
     """
-    global _flush_timer
-    with _buffer_lock:
-        if _flush_timer is not None:
-            _flush_timer.cancel()
-            _flush_timer = None
     _flush_buffer()
 
 
+@atexit.register
+def _shutdown() -> None:
+    """Flush what is still buffered and close the log descriptor at exit."""
+    _flush_buffer()
+    with _buffer_lock:
+        _close_fd()
+
+
 def reset_state():
     """Reset all internal state. For testing only."""
-    global _current_fh, _current_date, _size_exceeded, _flush_timer
+    global _current_date, _rollover_at, _dir_checked
     flush_metrics()
     with _buffer_lock:
         _buffer.clear()
-    if _current_fh is not None:
-        try:
-            _current_fh.close()
-        except Exception:
-            pass
-        _current_fh = None
+        _close_fd()
     _current_date = ""
-    _size_exceeded = False
+    _rollover_at = 0.0
+    _dir_checked = None
     _sample_counters.clear()
 
 
@@ -178,15 +336,17 @@ def timing(metric: str, ms: float, *, sample_rate: int = 1, **labels: Any) -> No
         sample_rate: Only log every Nth call (default 1 = log all)
         **labels: Additional labels (component, session, etc.)
     """
-    if sample_rate > 1:
-        _sample_counters[metric] = _sample_counters.get(metric, 0) + 1
-        if _sample_counters[metric] % sample_rate != 0:
-            return
+    if sample_rate > 1 and next(_sample_counters[metric]) % sample_rate != sample_rate - 1:
+        return
     _log_metric(metric, ms, **labels)
 
 
 def incr(metric: str, count: int = 1, **labels: Any) -> None:
-    """Record a counter increment."""
+    """Record a counter increment.
+
+    Each call is its own line: perf-analyze, the dashboard and the jq
+    recipes in the perf skill count lines for messages_read and error_count.
+    """
     _log_metric(metric, count, **labels)
 
 
@@ -204,11 +364,11 @@ def timed(metric: str, *, sample_rate: int = 1, **labels: Any):
         with timed("inject_ms", component="daemon"):
             do_something()
     """
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     try:
         yield
     finally:
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
         timing(metric, elapsed_ms, sample_rate=sample_rate, **labels)
 
 
@@ -231,11 +391,11 @@ def timed_fn(metric: str, *, sample_rate: int = 1, **labels: Any):
 
             @wraps(fn)
             async def async_wrapper(*args, **kwargs):
-                start = time.perf_counter()
+                start = time.perf_counter_ns()
                 try:
                     return await fn(*args, **kwargs)
                 finally:
-                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
                     timing(metric, elapsed_ms, sample_rate=sample_rate, **labels)
 
             return async_wrapper
@@ -243,11 +403,11 @@ def timed_fn(metric: str, *, sample_rate: int = 1, **labels: Any):
 
             @wraps(fn)
             def sync_wrapper(*args, **kwargs):
-                start = time.perf_counter()
+                start = time.perf_counter_ns()
                 try:
                     return fn(*args, **kwargs)
                 finally:
-                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
                     timing(metric, elapsed_ms, sample_rate=sample_rate, **labels)
 
             return sync_wrapper
@@ -256,7 +416,11 @@ def timed_fn(metric: str, *, sample_rate: int = 1, **labels: Any):
 
 
 def error(error_type: str, **labels: Any) -> None:
-    """Record an error occurrence."""
+    """Record an error occurrence.
+
+    Errors are counters, one line per occurrence; the label span of a
+    repeated error_type/labels pair comes from the cached label bytes.
+    """
     incr("error_count", error_type=error_type, **labels)
 
 
@@ -264,28 +428,44 @@ def error(error_type: str, **labels: Any) -> None:
 
 import re
 import shlex
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 SKILL_PATTERN = re.compile(r'\.claude/skills/([^/]+)/scripts/([^/\s]+)')
 
+# Shell words made of bare runs and '...'/"..." strings (no backslashes)
+_SHELL_WORD_RE = re.compile(r"""(?:[^ \t\r\n"']+|"[^"]*"|'[^']*')+""")
+_SHELL_QUOTED_RE = re.compile(r""""([^"]*)"|'([^']*)'""")
+
+
+def _split_command(command: str) -> list[str]:
+    """shlex.split() equivalent with a regex fast path.
+
+    Without backslashes, POSIX word splitting reduces to concatenating bare
+    runs and quoted strings, which two compiled regexes handle; escapes and
+    unbalanced quotes go through shlex (and the plain-split fallback).
+    """
+    if "\\" not in command and not _SHELL_WORD_RE.sub("", command).strip(" \t\r\n"):
+        return [_SHELL_QUOTED_RE.sub(r"\1\2", word) for word in _SHELL_WORD_RE.findall(command)]
+    try:
+        return shlex.split(command)
+    except ValueError:
+        return command.split()
+
 
 def parse_bash(tool_input: dict[str, Any]) -> dict[str, Any]:
     """Parse Bash command into structured fields."""
     command = tool_input.get("command", "")
     result: dict[str, Any] = {"command": command}
 
-    try:
-        result["cmd_argv"] = shlex.split(command)
-    except ValueError:
-        result["cmd_argv"] = command.split()
+    result["cmd_argv"] = _split_command(command)
 
-    # Detect skill from path
-    match = SKILL_PATTERN.search(command)
+    # Detect skill from path (substring check first: most commands aren't skills)
+    match = SKILL_PATTERN.search(command) if ".claude/skills/" in command else None
     if match:
         result["skill"] = match.group(1)
         result["cmd_name"] = match.group(2)
     elif result["cmd_argv"]:
-        result["cmd_name"] = Path(result["cmd_argv"][0]).name
+        result["cmd_name"] = result["cmd_argv"][0].rstrip("/").rpartition("/")[2]
 
     return result
 
@@ -294,20 +474,34 @@ def parse_file_tool(tool_input: dict[str, Any]) -> dict[str, Any]:
     """Parse Read/Write/Edit file path."""
     file_path = tool_input.get("file_path", "")
     result = dict(tool_input)
-    if file_path:
+    if not file_path:
+        return result
+    if "//" in file_path or "/." in file_path or file_path.startswith(".") or file_path.endswith("/"):
+        # Let pathlib normalize unusual paths
         p = Path(file_path)
         result["extension"] = p.suffix or None
         result["directory"] = str(p.parent)
+        return result
+    # Plain paths: one rpartition for the directory, one rfind for the suffix
+    directory, _, name = file_path.rpartition("/")
+    dot = name.rfind(".")
+    result["extension"] = name[dot:] if 0 < dot < len(name) - 1 else None
+    result["directory"] = directory or ("/" if file_path.startswith("/") else ".")
     return result
 
 
+@lru_cache(maxsize=1024)
+def _url_domain(url: str) -> str | None:
+    """Network location of a URL (agents refetch the same URLs, so cached)."""
+    return urlsplit(url).netloc or None
+
+
 def parse_web_fetch(tool_input: dict[str, Any]) -> dict[str, Any]:
     """Parse WebFetch URL."""
     url = tool_input.get("url", "")
     result = dict(tool_input)
     if url:
-        parsed = urlparse(url)
-        result["domain"] = parsed.netloc or None
+        result["domain"] = _url_domain(url)
     return result
 
 
@@ -355,3 +549,20 @@ def log_tool_execution(
         input=parsed_input,
         **extra,
     )
+
+
+# ── Disabled Mode ───────────────────────────────────────────────────────
+
+if not PERF_ENABLED:
+    _NULL_TIMER = nullcontext()
+
+    def _noop(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    def timed(metric: str, *, sample_rate: int = 1, **labels: Any):
+        return _NULL_TIMER
+
+    def timed_fn(metric: str, *, sample_rate: int = 1, **labels: Any):
+        return lambda fn: fn
+
+    timing = incr = gauge = error = log_tool_execution = _noop
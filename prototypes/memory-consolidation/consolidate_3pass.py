@@ -88,6 +88,10 @@ def is_partner_contact(contact_name: str) -> bool:
 MANAGED_HEADER = "<!-- CLAUDE-MANAGED:v1 -->"
 LAST_UPDATED_PATTERN = r"\*Last updated: (\d{4}-\d{2}-\d{2} \d{2}:\d{2})\*"
 
+# Agent output parsing: fenced block first, else decode the first array of objects
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n?([\s\S]*?)\n?```')
+_JSON_DECODER = json.JSONDecoder()
+
 # Tier-specific emphasis
 TIER_EMPHASIS = {
     "wife": """ESPECIALLY IMPORTANT for this person (spouse/partner):
@@ -391,13 +395,16 @@ def load_exclusions() -> list[str]:
     return patterns
 
 
-def is_excluded(fact: str, exclusions: list[str]) -> bool:
-    """Check if a fact matches any exclusion pattern."""
-    fact_lower = fact.lower()
-    for pattern in exclusions:
-        if pattern in fact_lower:
-            return True
-    return False
+def compile_exclusions(exclusions: list[str]) -> Optional[re.Pattern]:
+    """Compile exclusion patterns into one case-insensitive regex (None if empty)."""
+    if not exclusions:
+        return None
+    return re.compile('|'.join(re.escape(e) for e in exclusions), re.IGNORECASE)
+
+
+def is_excluded(fact: str, exclusion_re: Optional[re.Pattern]) -> bool:
+    """Check if a fact matches any exclusion pattern (see compile_exclusions)."""
+    return exclusion_re is not None and exclusion_re.search(fact) is not None
 
 
 def count_messages(phone: str) -> int:
@@ -464,22 +471,25 @@ def call_claude_agent(system_prompt: str, user_prompt: str, verbose: bool = Fals
 
 def extract_json_from_output(output: str) -> list:
     """Extract JSON array from agent output (may have markdown fences)."""
-    # Try to find JSON array in the output
     # Handle ```json ... ``` blocks
-    json_match = re.search(r'```(?:json)?\s*\n?([\s\S]*?)\n?```', output)
+    json_match = _JSON_FENCE_RE.search(output)
     if json_match:
         try:
             return json.loads(json_match.group(1))
         except json.JSONDecodeError:
             pass
 
-    # Try to find raw JSON array
-    array_match = re.search(r'\[\s*\{[\s\S]*?\}\s*\]', output)
-    if array_match:
+    # Decode the first JSON array of objects in the output, skipping other
+    # bracketed text such as "Found [1] candidate:"
+    start = output.find('[')
+    while start != -1:
         try:
-            return json.loads(array_match.group(0))
+            value = _JSON_DECODER.raw_decode(output, start)[0]
         except json.JSONDecodeError:
-            pass
+            value = None
+        if value and isinstance(value, list) and all(isinstance(d, dict) for d in value):
+            return value
+        start = output.find('[', start + 1)
 
     # Try parsing the whole output
     try:
@@ -627,10 +637,10 @@ Verify each quote exists and fact is accurate."""
             print(f"    ✓ {fact}")
 
     # Filter out excluded facts
-    exclusions = load_exclusions()
-    if exclusions:
-        excluded_facts = [f for f in final_facts if is_excluded(f, exclusions)]
-        final_facts = [f for f in final_facts if not is_excluded(f, exclusions)]
+    exclusion_re = compile_exclusions(load_exclusions())
+    if exclusion_re:
+        excluded_facts = [f for f in final_facts if is_excluded(f, exclusion_re)]
+        final_facts = [f for f in final_facts if not is_excluded(f, exclusion_re)]
         if excluded_facts and verbose:
             print(f"  [EXCLUSIONS] Filtered out {len(excluded_facts)} facts:")
             for fact in excluded_facts:
@@ -18,13 +18,14 @@ Usage:
 # ///
 
 import argparse
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
 import tempfile
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -43,6 +44,25 @@ MANAGED_HEADER = "<!-- CLAUDE-MANAGED:v1 -->"
 MAX_CONTEXT_SIZE = 2048  # 2KB max
 STALE_DAYS = 14  # Prune items not mentioned in 14+ days
 
+# CONTEXT.md parsing: a section runs until the next known header
+_SECTION_KEYS = {
+    "Ongoing": "ongoing",
+    "Pending": "pending",
+    "Recent Topics": "topics",
+    "Preferences": "preferences",
+}
+_SECTION_RE = re.compile(
+    r'^[ \t]*## (Ongoing|Pending|Recent Topics|Preferences).*?$'
+    r'(.*?)(?=^[ \t]*## (?:Ongoing|Pending|Recent Topics|Preferences)|\Z)',
+    re.M | re.S,
+)
+_ITEM_RE = re.compile(r'^[ \t]*- (.*?\S)[ \t\r]*$', re.M)
+_DATE_RE = re.compile(r'\s*\[(\d{4}-\d{2}-\d{2})\]')
+
+# Agent output parsing: fenced block first, else decode from the first bracket
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n?([\s\S]*?)\n?```')
+_JSON_DECODER = json.JSONDecoder()
+
 # ============================================================
 # CRITICAL: PROPOSAL LEAK PROTECTION
 # ============================================================
@@ -235,47 +255,41 @@ def format_context_md(
     preferences: list[dict]
 ) -> str:
     """Format context items into CONTEXT.md content."""
-
-    lines = [MANAGED_HEADER]
-
-    if ongoing:
-        lines.append("## Ongoing")
-        for item in ongoing[:5]:  # Max 5
-            lines.append(f"- {item['item']} [{item.get('date', datetime.now().strftime('%Y-%m-%d'))}]")
-        lines.append("")
-
-    if pending:
-        lines.append("## Pending")
-        for item in pending[:5]:  # Max 5
-            lines.append(f"- {item['item']}")
-        lines.append("")
-
-    if topics:
-        lines.append("## Recent Topics")
-        for item in topics[:5]:  # Max 5
-            lines.append(f"- {item['item']}")
-        lines.append("")
-
-    if preferences:
-        lines.append("## Preferences")
-        for item in preferences[:3]:  # Max 3
-            lines.append(f"- {item['item']}")
-        lines.append("")
-
-    lines.append("---")
-    lines.append(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-
-    content = "\n".join(lines)
-
-    # Enforce max size
-    if len(content) > MAX_CONTEXT_SIZE:
-        # Truncate topics first, then ongoing
-        while len(content) > MAX_CONTEXT_SIZE and topics:
-            topics.pop()
-            content = format_context_md(ongoing, pending, topics, preferences)
-        while len(content) > MAX_CONTEXT_SIZE and ongoing:
-            ongoing.pop()
-            content = format_context_md(ongoing, pending, topics, preferences)
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+
+    # Item lines per section, already cut to the section maximums
+    ongoing_lines = [f"- {item['item']} [{item.get('date', today)}]" for item in ongoing[:5]]
+    pending_lines = [f"- {item['item']}" for item in pending[:5]]
+    topic_lines = [f"- {item['item']}" for item in topics[:5]]
+    preference_lines = [f"- {item['item']}" for item in preferences[:3]]
+    sections = (
+        ("## Ongoing", ongoing_lines),
+        ("## Pending", pending_lines),
+        ("## Recent Topics", topic_lines),
+        ("## Preferences", preference_lines),
+    )
+    footer = ["---", f"*Last updated: {now.strftime('%Y-%m-%d %H:%M')}*"]
+
+    def render() -> str:
+        lines = [MANAGED_HEADER]
+        for header, item_lines in sections:
+            if item_lines:
+                lines.append(header)
+                lines.extend(item_lines)
+                lines.append("")
+        lines.extend(footer)
+        return "\n".join(lines)
+
+    content = render()
+
+    # Enforce max size: truncate topics first, then ongoing
+    while len(content) > MAX_CONTEXT_SIZE and topic_lines:
+        topic_lines.pop()
+        content = render()
+    while len(content) > MAX_CONTEXT_SIZE and ongoing_lines:
+        ongoing_lines.pop()
+        content = render()
 
     return content
 
@@ -319,37 +333,28 @@ def parse_existing_context(content: str) -> dict:
     if not content:
         return result
 
-    current_section = None
-    for line in content.split("\n"):
-        line = line.strip()
-        if line.startswith("## Ongoing"):
-            current_section = "ongoing"
-        elif line.startswith("## Pending"):
-            current_section = "pending"
-        elif line.startswith("## Recent Topics"):
-            current_section = "topics"
-        elif line.startswith("## Preferences"):
-            current_section = "preferences"
-        elif line.startswith("- ") and current_section:
-            item_text = line[2:]
+    for section in _SECTION_RE.finditer(content):
+        items = result[_SECTION_KEYS[section.group(1)]]
+        for item_text in _ITEM_RE.findall(section.group(2)):
             # Extract date if present
-            date_match = re.search(r'\[(\d{4}-\d{2}-\d{2})\]', item_text)
+            date_match = _DATE_RE.search(item_text)
             date = date_match.group(1) if date_match else None
-            item = re.sub(r'\s*\[\d{4}-\d{2}-\d{2}\]', '', item_text)
-            result[current_section].append({"item": item, "date": date})
+            item = _DATE_RE.sub('', item_text)
+            items.append({"item": item, "date": date})
 
     return result
 
 
 def prune_stale_items(items: list[dict], stale_days: int = STALE_DAYS) -> list[dict]:
     """Remove items not mentioned in stale_days."""
-    cutoff = datetime.now() - timedelta(days=stale_days)
+    # Items are dated at midnight, so "on or after now - stale_days" means
+    # strictly after that day
+    cutoff = (datetime.now() - timedelta(days=stale_days)).date()
     result = []
     for item in items:
         if item.get("date"):
             try:
-                item_date = datetime.strptime(item["date"], "%Y-%m-%d")
-                if item_date >= cutoff:
+                if date.fromisoformat(item["date"]) > cutoff:
                     result.append(item)
             except ValueError:
                 result.append(item)  # Keep if date parsing fails
@@ -409,20 +414,20 @@ def call_claude_agent(system_prompt: str, user_prompt: str, verbose: bool = Fals
 def extract_json_from_output(output: str) -> dict:
     """Extract JSON object from agent output."""
     # Try to find JSON in markdown code blocks
-    json_match = re.search(r'```(?:json)?\s*\n?([\s\S]*?)\n?```', output)
+    json_match = _JSON_FENCE_RE.search(output)
     if json_match:
         try:
             return json.loads(json_match.group(1))
         except json.JSONDecodeError:
             pass
 
-    # Try to find raw JSON object
-    obj_match = re.search(r'\{[\s\S]*\}', output)
-    if obj_match:
+    # Decode the first complete JSON object in the output
+    start = output.find('{')
+    while start != -1:
         try:
-            return json.loads(obj_match.group(0))
+            return _JSON_DECODER.raw_decode(output, start)[0]
         except json.JSONDecodeError:
-            pass
+            start = output.find('{', start + 1)
 
     return {}
 
@@ -445,6 +450,7 @@ def get_contact_name(chat_id: str) -> str:
     return f"Group {chat_id[:8]}"
 
 
+@functools.lru_cache(maxsize=4096)
 def is_group_chat(chat_id: str) -> bool:
     """Check if a chat_id is a group chat (hex UUID vs phone number)."""
     # Phone numbers start with + or _ (sanitized +)
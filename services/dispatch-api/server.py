@@ -83,7 +83,11 @@ def _normalize_session_id(session_id: str) -> str:
 
 
 def log_perf(metric: str, value: float, **labels) -> None:
-    """Log a perf metric to the shared JSONL file."""
+    """Log a perf metric to the shared JSONL file.
+
+    The path is opened per call, so once assistant.perf rotates a full log
+    aside the next entry goes to the fresh perf-DATE.jsonl.
+    """
     try:
         perf_dir = Path.home() / "dispatch" / "logs"
         perf_dir.mkdir(parents=True, exist_ok=True)
@@ -3816,8 +3820,16 @@ async def dashboard_perf(hours: int = 24, metric: Optional[str] = None):
             d = datetime.fromtimestamp(now.timestamp() - h * 3600)
             dates_to_check.add(d.strftime("%Y-%m-%d"))
 
+        perf_files = []
         for date_str in sorted(dates_to_check):
-            perf_file = PERF_LOG_DIR / f"perf-{date_str}.jsonl"
+            # Rotated segments (perf-DATE.N.jsonl) hold that day's earlier entries
+            perf_files.extend(sorted(
+                PERF_LOG_DIR.glob(f"perf-{date_str}.*.jsonl"),
+                key=lambda p: int(p.suffixes[-2][1:]) if p.suffixes[-2][1:].isdigit() else 0,
+            ))
+            perf_files.append(PERF_LOG_DIR / f"perf-{date_str}.jsonl")
+
+        for perf_file in perf_files:
             if not perf_file.exists():
                 continue
             try:
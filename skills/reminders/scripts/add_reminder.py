@@ -7,11 +7,18 @@ import sys
 from datetime import datetime, timedelta
 import re
 
+# Compiled once at import; parse_time_spec runs per reminder on bulk imports
+RELATIVE_RE = re.compile(r'^(\d+)\s*(m|min|minutes?|h|hr|hours?|d|days?)$')
+CLOCK_TIME_RE = re.compile(r'^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$')
+DATE_FORMATS = ('%Y-%m-%d %H:%M', '%Y-%m-%d', '%m/%d/%Y %H:%M', '%m/%d/%Y')
 
-def parse_time_spec(spec):
+
+def parse_time_spec(spec: str, now: datetime | None = None) -> datetime:
     """
     Parse a time specification into a datetime.
 
+    Relative specs are resolved against `now` (defaults to datetime.now()).
+
     Formats:
     - "5m" or "5 minutes" -> 5 minutes from now
     - "2h" or "2 hours" -> 2 hours from now
@@ -20,10 +27,11 @@ def parse_time_spec(spec):
     - "2026-01-24 14:30" -> specific datetime
     """
     spec = spec.strip().lower()
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
 
     # Relative time: 5m, 2h, 1d
-    match = re.match(r'^(\d+)\s*(m|min|minutes?|h|hr|hours?|d|days?)$', spec)
+    match = RELATIVE_RE.match(spec)
     if match:
         amount = int(match.group(1))
         unit = match.group(2)[0]
@@ -40,7 +48,7 @@ def parse_time_spec(spec):
         time_part = spec.replace('tomorrow', '').strip()
         if time_part:
             # Parse time like "9am", "2pm", "14:30"
-            time_match = re.match(r'^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$', time_part)
+            time_match = CLOCK_TIME_RE.match(time_part)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2) or 0)
@@ -59,7 +67,7 @@ def parse_time_spec(spec):
         pass
 
     # Try parsing various formats
-    for fmt in ['%Y-%m-%d %H:%M', '%Y-%m-%d', '%m/%d/%Y %H:%M', '%m/%d/%Y']:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(spec, fmt)
         except ValueError:
@@ -16,6 +16,13 @@ CORE_DATA_EPOCH = 978307200
 # Prefix for contact-specific lists
 CONTACT_LIST_PREFIX = "Claude: "
 
+# Tags embedded in reminder notes, e.g. "[target:bg] [cron:0 9 * * *] text"
+LEADING_TARGET_RE = re.compile(r'^\[target:(fg|bg|both)\]\s*(.*)$', re.DOTALL)
+CRON_RE = re.compile(r'\[cron:([^\]]+)\]')
+CRON_TAG_RE = re.compile(r'\[cron:[^\]]+\]\s*')
+TAG_RE = re.compile(r'\[(target|cron):([^\]]+)\]\s*')  # either tag, with its value
+TARGETS = ("fg", "bg", "both")
+
 
 def find_all_reminders_dbs():
     """Find all Reminders databases."""
@@ -54,7 +61,7 @@ def extract_target_from_notes(notes):
     if not notes:
         return "fg", None
 
-    match = re.match(r'^\[target:(fg|bg|both)\]\s*(.*)$', notes, re.DOTALL)
+    match = LEADING_TARGET_RE.match(notes)
     if match:
         return match.group(1), match.group(2).strip() or None
     return "fg", notes
@@ -65,10 +72,10 @@ def extract_cron_from_notes(notes):
     if not notes:
         return None, None
 
-    match = re.search(r'\[cron:([^\]]+)\]', notes)
+    match = CRON_RE.search(notes)
     if match:
         cron_pattern = match.group(1).strip()
-        cleaned = re.sub(r'\[cron:[^\]]+\]\s*', '', notes).strip() or None
+        cleaned = CRON_TAG_RE.sub('', notes).strip() or None
         return cron_pattern, cleaned
     return None, notes
 
@@ -79,21 +86,31 @@ def parse_tags_from_notes(notes):
     if not notes:
         return result
 
-    remaining = notes
-
-    # Extract target
-    target_match = re.search(r'\[target:(fg|bg|both)\]', remaining)
-    if target_match:
-        result["target"] = target_match.group(1)
-        remaining = re.sub(r'\[target:[^\]]+\]\s*', '', remaining)
-
-    # Extract cron
-    cron_match = re.search(r'\[cron:([^\]]+)\]', remaining)
-    if cron_match:
-        result["cron"] = cron_match.group(1).strip()
-        remaining = re.sub(r'\[cron:[^\]]+\]\s*', '', remaining)
-
-    result["notes"] = remaining.strip() or None
+    # One scan finds both tags (first valid one of each wins) and the text
+    # between them, which becomes the cleaned notes. Target tags are only
+    # stripped once a valid one is found, so they are kept in place until then.
+    target = None
+    kept = []
+    target_tags = []  # indexes into kept holding [target:...] tag text
+    pos = 0
+    for match in TAG_RE.finditer(notes):
+        kind, value = match.groups()
+        kept.append(notes[pos:match.start()])
+        if kind == "target":
+            if target is None and value in TARGETS:
+                target = value
+            target_tags.append(len(kept))
+            kept.append(match.group())
+        elif result["cron"] is None:
+            result["cron"] = value.strip()
+        pos = match.end()
+    kept.append(notes[pos:])
+
+    if target:
+        result["target"] = target
+        for i in target_tags:
+            kept[i] = ""
+    result["notes"] = "".join(kept).strip() or None
     return result
 
 
@@ -117,12 +134,12 @@ def get_due_reminders(db_path, include_all=False, contact=None):
     # Current time as Core Data timestamp
     now_core_data = datetime.now().timestamp() - CORE_DATA_EPOCH
 
-    # Build the query
+    # Build the query (SQLite converts due dates to Unix time while scanning)
     base_query = """
         SELECT
             r.Z_PK as id,
             r.ZTITLE as title,
-            r.ZDUEDATE as due_date_raw,
+            NULLIF(r.ZDUEDATE, 0) + ? as due_ts,
             r.ZNOTES as notes,
             r.ZCOMPLETED as completed,
             r.ZPRIORITY as priority,
@@ -135,7 +152,7 @@ def get_due_reminders(db_path, include_all=False, contact=None):
     """
 
     conditions = []
-    params = []
+    params = [CORE_DATA_EPOCH]
 
     if not include_all:
         conditions.append("r.ZDUEDATE <= ?")
@@ -154,7 +171,7 @@ def get_due_reminders(db_path, include_all=False, contact=None):
 
     reminders = []
     for row in cursor.fetchall():
-        due_ts = row["due_date_raw"] + CORE_DATA_EPOCH if row["due_date_raw"] else None
+        due_ts = row["due_ts"]
         due_dt = datetime.fromtimestamp(due_ts) if due_ts else None
         list_name = row["list_name"] or "Reminders"
 
@@ -199,7 +216,7 @@ def get_cron_reminders(db_path, contact=None):
         SELECT
             r.Z_PK as id,
             r.ZTITLE as title,
-            r.ZDUEDATE as due_date_raw,
+            NULLIF(r.ZDUEDATE, 0) + ? as until_ts,
             r.ZNOTES as notes,
             r.ZPRIORITY as priority,
             l.ZNAME as list_name
@@ -210,7 +227,7 @@ def get_cron_reminders(db_path, contact=None):
           AND r.ZNOTES LIKE '%[cron:%'
     """
 
-    params = []
+    params = [CORE_DATA_EPOCH]
     if contact:
         base_query += " AND l.ZNAME = ?"
         params.append(f"{CONTACT_LIST_PREFIX}{contact}")
@@ -223,7 +240,7 @@ def get_cron_reminders(db_path, contact=None):
         tags = parse_tags_from_notes(row["notes"])
 
         # Parse until_date from due_date (cron fires until this date, then auto-completes)
-        until_ts = row["due_date_raw"] + CORE_DATA_EPOCH if row["due_date_raw"] else None
+        until_ts = row["until_ts"]
         until_dt = datetime.fromtimestamp(until_ts) if until_ts else None
 
         # Only include if it has a cron pattern
@@ -12,6 +12,7 @@ Usage:
 import json
 import argparse
 import os
+import re
 import subprocess
 from pathlib import Path
 from collections import deque
@@ -22,6 +23,9 @@ CONTACTS_CLI = os.path.expanduser("~/.claude/skills/contacts/scripts/contacts")
 # Cache for tier lookups
 _tier_cache = {}
 
+# Message body of an injected SMS: everything after the sender line up to the end marker
+SMS_BODY_RE = re.compile(r'---SMS FROM[^\n]*\n(.*?)---END SMS---', re.DOTALL)
+
 
 def session_to_contact_name(session_name):
     """Convert session name (jane-doe) to contact name (Jane Doe)."""
@@ -81,14 +85,14 @@ def find_transcripts(session_name=None):
 
 def extract_sms_from_prompt(text):
     """Extract just the SMS content from an injection prompt."""
-    # Look for the actual message between SMS markers
-    if '---SMS FROM' in text and '---END SMS---' in text:
-        start = text.find('---SMS FROM')
-        # Find sender line and skip it
-        msg_start = text.find('\n', start) + 1
-        end = text.find('---END SMS---')
-        if msg_start > 0 and end > msg_start:
-            return text[msg_start:end].strip()
+    # Look for the actual message between SMS markers, skipping the sender line.
+    # Only the first header is tried, so a prompt full of unterminated headers
+    # costs one linear scan rather than one per header.
+    start = text.find('---SMS FROM')
+    if start != -1:
+        match = SMS_BODY_RE.match(text, start)
+        if match:
+            return match.group(1).strip()
     return None
 
 
@@ -121,8 +125,9 @@ def extract_context(transcript_path, limit=15):
                             if c.get('type') == 'tool_result':
                                 result = str(c.get('content', ''))
                                 # Skip noisy results - only keep meaningful ones
-                                if ('SENT|' not in result and
-                                    len(result) > 20 and
+                                # (length first: it rejects without scanning)
+                                if (len(result) > 20 and
+                                    'SENT|' not in result and
                                     'Exit code' not in result and
                                     '===' not in result):
                                     entries.append(f"[{timestamp}] RESULT: {result}")
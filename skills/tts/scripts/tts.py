@@ -8,6 +8,7 @@ import argparse
 import base64
 import json
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -24,6 +25,9 @@ TTS_ENDPOINT = "https://texttospeech.googleapis.com/v1/text:synthesize"
 # Maximum bytes per request (Google limit is 5000 bytes, ~5000 chars)
 MAX_CHUNK_SIZE = 4500
 
+# Whitespace following sentence-ending punctuation
+SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 def synthesize_text(text: str, voice: str = "en-US-Neural2-D", speaking_rate: float = 1.0) -> bytes:
     """Synthesize text to audio bytes."""
@@ -64,35 +68,47 @@ def synthesize_text(text: str, voice: str = "en-US-Neural2-D", speaking_rate: fl
 def chunk_text(text: str, max_size: int = MAX_CHUNK_SIZE) -> list[str]:
     """Split text into chunks that fit within API limits."""
     # Split by sentences first
-    import re
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    
+    sentences = SENTENCE_BREAK_RE.split(text)
+
     chunks = []
-    current_chunk = ""
-    
+    # The current chunk is kept as a list of pieces plus its joined length,
+    # so growing it never copies what is already there
+    parts = []
+    size = 0
+
     for sentence in sentences:
-        if len(current_chunk) + len(sentence) + 1 <= max_size:
-            current_chunk += (" " if current_chunk else "") + sentence
+        if size + len(sentence) + 1 <= max_size:
+            if size:
+                parts.append(" ")
+                size += 1
+            parts.append(sentence)
+            size += len(sentence)
         else:
-            if current_chunk:
-                chunks.append(current_chunk)
+            if size:
+                chunks.append("".join(parts))
             # If single sentence is too long, split by words
             if len(sentence) > max_size:
-                words = sentence.split()
-                current_chunk = ""
-                for word in words:
-                    if len(current_chunk) + len(word) + 1 <= max_size:
-                        current_chunk += (" " if current_chunk else "") + word
+                parts = []
+                size = 0
+                for word in sentence.split():
+                    if size + len(word) + 1 <= max_size:
+                        if size:
+                            parts.append(" ")
+                            size += 1
+                        parts.append(word)
+                        size += len(word)
                     else:
-                        if current_chunk:
-                            chunks.append(current_chunk)
-                        current_chunk = word
+                        if size:
+                            chunks.append("".join(parts))
+                        parts = [word]
+                        size = len(word)
             else:
-                current_chunk = sentence
-    
-    if current_chunk:
-        chunks.append(current_chunk)
-    
+                parts = [sentence]
+                size = len(sentence)
+
+    if size:
+        chunks.append("".join(parts))
+
     return chunks
 
 
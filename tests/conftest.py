@@ -212,6 +212,14 @@ def _isolate_perf_dir(tmp_path):
         perf.reset_state()
 
 
+@pytest.fixture(autouse=True)
+def _isolate_session_logs(tmp_path):
+    """Redirect per-session log files to tmp_path instead of ~/dispatch/logs/sessions."""
+    from assistant import sdk_session
+    with patch.object(sdk_session, "SESSION_LOG_DIR", tmp_path):
+        yield
+
+
 @pytest.fixture
 def registry_file(tmp_path):
     """Create a temporary session registry file."""
@@ -0,0 +1,45 @@
+"""Shared fixtures for unit tests that exercise skill scripts."""
+
+import importlib
+import sys
+
+import pytest
+
+from tests.unit.paths import REPO_ROOT
+
+
+# Script dirs whose modules are imported by bare name (skill fixtures below,
+# memory-consolidation prototypes in test_memory_consolidation.py)
+SKILL_SCRIPT_DIRS = [
+    REPO_ROOT / "skills/contacts/scripts",
+    REPO_ROOT / "skills/reminders/scripts",
+    REPO_ROOT / "skills/sms-assistant/scripts",
+    REPO_ROOT / "skills/tts/scripts",
+    REPO_ROOT / "prototypes/memory-consolidation",
+]
+
+
+def pytest_configure(config):
+    """Register script dirs on sys.path once per process (incl. xdist workers)."""
+    for scripts_dir in SKILL_SCRIPT_DIRS:
+        path = str(scripts_dir)
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def contacts_core():
+    """The contacts skill's contacts_core module, imported on first use."""
+    return importlib.import_module("contacts_core")
+
+
+@pytest.fixture(scope="session")
+def read_transcript():
+    """The sms-assistant skill's read_transcript module, imported on first use."""
+    return importlib.import_module("read_transcript")
+
+
+@pytest.fixture(scope="session")
+def tts():
+    """The tts skill's tts module, imported on first use."""
+    return importlib.import_module("tts")
@@ -0,0 +1,11 @@
+"""Paths shared by the unit tests."""
+
+from pathlib import Path
+
+# The checkout under test; skill scripts and services are imported from here
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Resolved once per session; Path.home() goes through expanduser every call
+HOME = Path.home()
+TRANSCRIPTS = HOME / "transcripts"
+SKILLS = HOME / ".claude/skills"  # installed skills symlink
@@ -0,0 +1,97 @@
+"""Multi-pattern matcher shared by the PII scanning tests.
+
+patterns_found() reports which literal patterns occur in a blob of bytes,
+using one Hyperscan database when hyperscan is installed and one regex
+alternation otherwise.
+"""
+
+import functools
+import re
+
+# Guard import — hyperscan (Intel, x86 only) may not be installed
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _trie_alternation(patterns: list[bytes]) -> bytes:
+    """Regex source matching any of patterns, with shared prefixes factored out.
+
+    The IP patterns share one ``10.10.10.`` branch followed by
+    ``(?:2(?:2|3)|62)``, so a common prefix is matched once rather than once
+    per pattern. Where one pattern extends another the extension is a greedy
+    optional group, so the longest pattern wins at each position.
+    """
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for byte in pattern:
+            node = node.setdefault(byte, {})
+        node[None] = None  # end of a pattern
+
+    def render(node: dict) -> bytes:
+        branches = [
+            re.escape(bytes([byte])) + render(child)
+            for byte, child in sorted((b, c) for b, c in node.items() if b is not None)
+        ]
+        if not branches:
+            return b""
+        if None not in node:
+            return branches[0] if len(branches) == 1 else b"(?:" + b"|".join(branches) + b")"
+        return b"(?:" + b"|".join(branches) + b")?"
+
+    return render(trie)
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_matcher(patterns: tuple[str, ...]) -> re.Pattern:
+    """One bytes regex that finds every pattern in a single pass.
+
+    The alternation sits inside a lookahead so matches may overlap.
+    """
+    alternation = _trie_alternation([p.encode() for p in patterns])
+    return re.compile(b"(?=(" + alternation + b"))")
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_db(patterns: tuple[str, ...]) -> "hyperscan.Database":
+    """All patterns compiled into one Hyperscan block-mode database."""
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[re.escape(p.encode()) for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        # Report each pattern at most once per scan
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+    )
+    return db
+
+
+@functools.lru_cache(maxsize=None)
+def _first_bytes(patterns: tuple[str, ...]) -> tuple[bytes, ...]:
+    """The distinct bytes any pattern can start with."""
+    return tuple(sorted({p.encode()[:1] for p in patterns}))
+
+
+def patterns_found(content: bytes, patterns: tuple[str, ...]) -> list[str]:
+    """Return the patterns present in content, in the order given."""
+    # memchr-speed early exit: no pattern can match without its first byte
+    if all(content.find(b) == -1 for b in _first_bytes(patterns)):
+        return []
+    if HYPERSCAN_AVAILABLE:
+        hit_ids = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hit_ids.add(pattern_id)
+
+        _hyperscan_db(patterns).scan(content, match_event_handler=on_match)
+        return [p for i, p in enumerate(patterns) if i in hit_ids]
+
+    hits = {m.group(1).decode() for m in _pattern_matcher(patterns).finditer(content)}
+    if not hits:
+        return []
+    # A pattern shadowed by a longer one starting at the same position still
+    # occurs inside that longer hit
+    return [p for p in patterns if p in hits or any(p in hit for hit in hits)]
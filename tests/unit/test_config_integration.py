@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 import yaml
@@ -18,12 +18,19 @@ def reset_config():
     """Reset config module state before each test."""
     config._config = {}
     config._loaded = False
-    # Also reset the cached signal account
-    import assistant.common as common
-    common._SIGNAL_ACCOUNT = None
+    config._config_file = None
     yield
     config._config = {}
     config._loaded = False
+    config._config_file = None
+
+
+@pytest.fixture
+def reset_signal_cache():
+    """Reset the cached signal account (only for tests that read it)."""
+    import assistant.common as common
+    common._SIGNAL_ACCOUNT = None
+    yield
     common._SIGNAL_ACCOUNT = None
 
 
@@ -33,27 +40,28 @@ def write_config(tmp_path, data: dict) -> Path:
     return p
 
 
+@pytest.mark.usefixtures("reset_signal_cache")
 class TestSignalAccountFromConfig:
     def test_signal_account_reads_from_config(self, tmp_path):
         from assistant.common import signal_account
         cfg_file = write_config(tmp_path, {"signal": {"account": "+15551234567"}})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            result = signal_account()
+        config.use_file(cfg_file)
+        result = signal_account()
         assert result == "+15551234567"
 
     def test_signal_account_defaults_to_empty(self, tmp_path):
         from assistant.common import signal_account
         cfg_file = write_config(tmp_path, {"owner": {"name": "Test"}})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            result = signal_account()
+        config.use_file(cfg_file)
+        result = signal_account()
         assert result == ""
 
     def test_signal_account_caches(self, tmp_path):
         from assistant.common import signal_account
         cfg_file = write_config(tmp_path, {"signal": {"account": "+15551234567"}})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            result1 = signal_account()
-            result2 = signal_account()
+        config.use_file(cfg_file)
+        result1 = signal_account()
+        result2 = signal_account()
         assert result1 == result2 == "+15551234567"
 
 
@@ -61,8 +69,8 @@ class TestWrapAdminFromConfig:
     def test_wrap_admin_uses_config_name(self, tmp_path):
         from assistant.common import wrap_admin
         cfg_file = write_config(tmp_path, {"owner": {"name": "Test Owner"}})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            result = wrap_admin("do something")
+        config.use_file(cfg_file)
+        result = wrap_admin("do something")
         assert "Test Owner" in result
         assert "(admin)" in result
         assert "do something" in result
@@ -70,8 +78,8 @@ class TestWrapAdminFromConfig:
     def test_wrap_admin_defaults_to_admin(self, tmp_path):
         from assistant.common import wrap_admin
         cfg_file = write_config(tmp_path, {})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            result = wrap_admin("test")
+        config.use_file(cfg_file)
+        result = wrap_admin("test")
         assert "Admin" in result
 
 
@@ -79,25 +87,25 @@ class TestManagerConfigValidation:
     def test_manager_requires_owner_config(self, tmp_path):
         """Manager startup should fail fast if owner config is missing."""
         cfg_file = write_config(tmp_path, {})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            with pytest.raises(ValueError, match="Required config.*missing or falsy"):
-                config.require("owner.name")
+        config.use_file(cfg_file)
+        with pytest.raises(ValueError, match="Required config.*missing or falsy"):
+            config.require("owner.name")
 
     def test_manager_requires_owner_phone(self, tmp_path):
         cfg_file = write_config(tmp_path, {"owner": {"name": "Test"}})
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            with pytest.raises(ValueError, match="Required config.*missing or falsy"):
-                config.require("owner.phone")
+        config.use_file(cfg_file)
+        with pytest.raises(ValueError, match="Required config.*missing or falsy"):
+            config.require("owner.phone")
 
     def test_manager_passes_with_valid_config(self, tmp_path):
         cfg_file = write_config(tmp_path, {
             "owner": {"name": "Test User", "phone": "+15551234567"},
             "signal": {"account": "+15559876543"},
         })
-        with patch.object(config, "LOCAL_CONFIG_FILE", cfg_file):
-            assert config.require("owner.name") == "Test User"
-            assert config.require("owner.phone") == "+15551234567"
-            assert config.get("signal.account") == "+15559876543"
+        config.use_file(cfg_file)
+        assert config.require("owner.name") == "Test User"
+        assert config.require("owner.phone") == "+15551234567"
+        assert config.get("signal.account") == "+15559876543"
 
 
 class TestConfigExampleYaml:
@@ -1,131 +1,157 @@
 """Unit tests for contacts functionality."""
 
-import subprocess
-from unittest.mock import patch, MagicMock
-import sys
+from subprocess import CompletedProcess, TimeoutExpired
+from unittest.mock import patch
 
-# Add contacts skill to path for imports
-sys.path.insert(0, str(__import__('pathlib').Path.home() / "dispatch/skills/contacts/scripts"))
+import pytest
 
-from contacts_core import (
-    ensure_contacts_running,
-    run_applescript,
-    lookup_phone,
-)
+# contacts_core is provided by the session-scoped fixture in conftest.py
+
+# Canned osascript results (run_applescript only reads returncode/stdout/stderr)
+CP_EMPTY = CompletedProcess([], 0, "", "")
+CP_OK = CompletedProcess([], 0, "test output\n", "")
+CP_SUCCESS = CompletedProcess([], 0, "success\n", "")
+CP_600 = CompletedProcess([], 1, "", "execution error: (-600)")
+CP_OTHER_ERR = CompletedProcess([], 1, "", "some other error")
+CP_TIMEOUT = TimeoutExpired(["osascript"], 15)
+
+APPLESCRIPT = 'tell application "Contacts" to return "test"'
+LAUNCH_ARGV = ["osascript", "-e", 'tell application "Contacts" to launch']
+
+
+@pytest.fixture
+def mock_subproc(contacts_core):
+    """contacts_core.subprocess.run, patched for this test only."""
+    with patch.object(contacts_core.subprocess, "run") as m:
+        yield m
+
+
+@pytest.fixture
+def mock_ensure(contacts_core):
+    """contacts_core.ensure_contacts_running, patched for this test only."""
+    with patch.object(contacts_core, "ensure_contacts_running") as m:
+        yield m
+
+
+@pytest.fixture
+def mock_sleep():
+    """Record retry delays instead of sleeping (run_applescript imports time lazily)."""
+    with patch("time.sleep") as m:
+        yield m
 
 
 class TestEnsureContactsRunning:
     """Tests for ensure_contacts_running function."""
 
-    @patch('contacts_core.subprocess.run')
-    def test_does_nothing_when_contacts_running(self, mock_run):
+    def test_does_nothing_when_contacts_running(self, contacts_core, mock_subproc):
         """Should not launch Contacts if already running."""
         # Simulate osascript succeeding (Contacts is running)
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_subproc.return_value = CP_EMPTY
 
-        ensure_contacts_running()
+        contacts_core.ensure_contacts_running()
 
         # Should call osascript to launch (our implementation always calls launch)
-        assert mock_run.called
+        assert mock_subproc.called
 
-    @patch('contacts_core.subprocess.run')
-    def test_launches_contacts_when_not_running(self, mock_run):
+    def test_launches_contacts_when_not_running(self, contacts_core, mock_subproc):
         """Should launch Contacts.app when it's not running."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_subproc.return_value = CP_EMPTY
 
-        ensure_contacts_running()
+        contacts_core.ensure_contacts_running()
 
         # Should call osascript to launch Contacts
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        assert "osascript" in call_args
-        assert "Contacts" in str(call_args)
+        assert mock_subproc.call_count == 1
+        assert mock_subproc.call_args.args[0] == LAUNCH_ARGV
 
 
 class TestRunApplescript:
     """Tests for run_applescript function with retry logic."""
 
-    @patch('contacts_core.ensure_contacts_running')
-    @patch('contacts_core.subprocess.run')
-    def test_returns_success_on_first_try(self, mock_run, mock_ensure):
+    def test_returns_success_on_first_try(self, contacts_core, mock_subproc, mock_ensure):
         """Should return success when AppleScript succeeds."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="test output\n",
-            stderr=""
-        )
+        mock_subproc.return_value = CP_OK
 
-        success, output = run_applescript('tell application "Contacts" to return "test"')
+        success, output = contacts_core.run_applescript(APPLESCRIPT)
 
         assert success is True
         assert output == "test output"
 
-    @patch('contacts_core.ensure_contacts_running')
-    @patch('contacts_core.subprocess.run')
-    def test_retries_on_app_not_running_error(self, mock_run, mock_ensure):
+    def test_retries_on_app_not_running_error(self, contacts_core, mock_subproc, mock_ensure, mock_sleep):
         """Should retry when getting -600 error (app not running)."""
         # First call fails with -600, second succeeds
-        mock_run.side_effect = [
-            MagicMock(returncode=1, stdout="", stderr="execution error: (-600)"),
-            MagicMock(returncode=0, stdout="success\n", stderr="")
-        ]
+        mock_subproc.side_effect = [CP_600, CP_SUCCESS]
 
-        success, output = run_applescript('tell application "Contacts" to return "test"')
+        success, output = contacts_core.run_applescript(APPLESCRIPT)
 
         # Should have called subprocess twice (initial + retry)
-        assert mock_run.call_count == 2
+        assert mock_subproc.call_count == 2
         # Should have called ensure_contacts_running to launch app
         assert mock_ensure.called
+        # Relaunching is enough; no delay before the retry
+        mock_sleep.assert_not_called()
         assert success is True
         assert output == "success"
 
-    @patch('contacts_core.ensure_contacts_running')
-    @patch('contacts_core.subprocess.run')
-    def test_returns_failure_on_other_errors(self, mock_run, mock_ensure):
+    def test_returns_failure_on_other_errors(self, contacts_core, mock_subproc, mock_ensure):
         """Should not retry on non -600 errors."""
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stdout="",
-            stderr="some other error"
-        )
+        mock_subproc.return_value = CP_OTHER_ERR
 
-        success, output = run_applescript('tell application "Contacts" to return "test"')
+        success, output = contacts_core.run_applescript(APPLESCRIPT)
 
         # Should only call once (no retry)
-        assert mock_run.call_count == 1
+        assert mock_subproc.call_count == 1
         assert success is False
         assert "some other error" in output
 
+    def test_kills_and_retries_once_after_timeout(self, contacts_core, mock_subproc, mock_ensure, mock_sleep):
+        """Should kill a hung Contacts.app, wait 1s, relaunch, and retry."""
+        # osascript times out, two pkill calls, then the retry succeeds
+        mock_subproc.side_effect = [CP_TIMEOUT, CP_EMPTY, CP_EMPTY, CP_SUCCESS]
+
+        success, output = contacts_core.run_applescript(APPLESCRIPT)
+
+        assert mock_subproc.call_count == 4
+        assert mock_subproc.call_args_list[1][0][0][0] == "pkill"
+        mock_sleep.assert_called_once_with(1)
+        mock_ensure.assert_called_once()
+        assert success is True
+        assert output == "success"
+
+    def test_gives_up_after_second_timeout(self, contacts_core, mock_subproc, mock_ensure, mock_sleep):
+        """Should not retry more than once when Contacts.app stays hung."""
+        mock_subproc.side_effect = [CP_TIMEOUT, CP_EMPTY, CP_EMPTY, CP_TIMEOUT]
+
+        success, output = contacts_core.run_applescript(APPLESCRIPT)
+
+        assert mock_subproc.call_count == 4
+        mock_sleep.assert_called_once_with(1)
+        assert success is False
+        assert output == "Contacts.app hung (timed out twice)"
+
 
 class TestLookupPhone:
     """Tests for lookup_phone function."""
 
-    @patch('contacts_core.run_applescript')
-    def test_returns_contact_when_found(self, mock_applescript):
+    def test_returns_contact_when_found(self, contacts_core):
         """Should return contact dict when phone is found."""
-        mock_applescript.return_value = (True, "FOUND|John Doe|+16175551234|admin")
-
-        result = lookup_phone("+16175551234")
+        with patch.object(contacts_core, "run_applescript", return_value=(True, "FOUND|John Doe|+16175551234|admin")):
+            result = contacts_core.lookup_phone("+16175551234")
 
         assert result is not None
         assert result["name"] == "John Doe"
         assert result["phone"] == "+16175551234"
         assert result["tier"] == "admin"
 
-    @patch('contacts_core.run_applescript')
-    def test_returns_none_when_not_found(self, mock_applescript):
+    def test_returns_none_when_not_found(self, contacts_core):
         """Should return None when phone is not in contacts."""
-        mock_applescript.return_value = (True, "NOT_FOUND|+19995551234")
-
-        result = lookup_phone("+19995551234")
+        with patch.object(contacts_core, "run_applescript", return_value=(True, "NOT_FOUND|+19995551234")):
+            result = contacts_core.lookup_phone("+19995551234")
 
         assert result is None
 
-    @patch('contacts_core.run_applescript')
-    def test_returns_none_on_applescript_failure(self, mock_applescript):
+    def test_returns_none_on_applescript_failure(self, contacts_core):
         """Should return None when AppleScript fails."""
-        mock_applescript.return_value = (False, "some error")
-
-        result = lookup_phone("+16175551234")
+        with patch.object(contacts_core, "run_applescript", return_value=(False, "some error")):
+            result = contacts_core.lookup_phone("+16175551234")
 
         assert result is None
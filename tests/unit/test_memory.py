@@ -1,106 +1,47 @@
 """Tests for memory.py - memory storage and retrieval logic."""
+import importlib
+
 import pytest
-import sys
-from pathlib import Path
-
-# Add skills path
-sys.path.insert(0, str(Path.home() / ".claude/skills/memory/scripts"))
-
-# Import the module - we'll test the keyword matching logic
-# Note: Most functions require database, but we can test the pure logic
-
-
-class TestKeywordMatching:
-    """Tests for keyword-to-type matching in ask_memories."""
-
-    # The type_keywords mapping from memory.py
-    TYPE_KEYWORDS = {
-        "preference": ["prefer", "like", "want", "style", "favorite"],
-        "fact": ["fact", "info", "know", "detail", "about"],
-        "project": ["project", "built", "work", "made", "created"],
-        "lesson": ["lesson", "learn", "figured", "discovered", "solved"],
-        "relationship": ["relationship", "family", "friend", "husband", "partner"],
-    }
-
-    def _get_matching_types(self, prompt: str) -> list:
-        """Helper to match prompt to types (mirrors ask_memories logic)."""
-        prompt_lower = prompt.lower()
-        relevant_types = []
-        for type_name, keywords in self.TYPE_KEYWORDS.items():
-            if any(kw in prompt_lower for kw in keywords):
-                relevant_types.append(type_name)
-        return relevant_types
-
-    def test_match_preference_keywords(self):
-        """Test matching preference-related prompts."""
-        assert "preference" in self._get_matching_types("What does he prefer?")
-        assert "preference" in self._get_matching_types("What are their favorite foods?")
-        assert "preference" in self._get_matching_types("What style do they like?")
-
-    def test_match_fact_keywords(self):
-        """Test matching fact-related prompts."""
-        assert "fact" in self._get_matching_types("What do I know about them?")
-        assert "fact" in self._get_matching_types("Give me info on this person")
-        assert "fact" in self._get_matching_types("What are the details?")
-
-    def test_match_project_keywords(self):
-        """Test matching project-related prompts."""
-        assert "project" in self._get_matching_types("What projects did we work on?")
-        assert "project" in self._get_matching_types("What have they built?")
-        assert "project" in self._get_matching_types("What was created?")  # "created" keyword
-        # Note: uses substring match, so "create" won't match "created"
-
-    def test_match_lesson_keywords(self):
-        """Test matching lesson-related prompts."""
-        assert "lesson" in self._get_matching_types("What lessons did we learn?")
-        assert "lesson" in self._get_matching_types("What did we figured out?")  # needs "figured"
-        assert "lesson" in self._get_matching_types("What problems did we solved?")  # needs "solved"
-        # Note: Uses exact substring matching, so "figure" won't match "figured"
-
-    def test_match_relationship_keywords(self):
-        """Test matching relationship-related prompts."""
-        assert "relationship" in self._get_matching_types("Who is their partner?")
-        assert "relationship" in self._get_matching_types("Tell me about their family")
-        assert "relationship" in self._get_matching_types("Who are their friends?")
-
-    def test_match_multiple_types(self):
-        """Test prompts that match multiple types."""
-        types = self._get_matching_types("What projects did we work on and what did we learn?")
-        assert "project" in types
-        assert "lesson" in types
-
-    def test_no_match_returns_empty(self):
-        """Test prompts that don't match any keywords."""
-        types = self._get_matching_types("Tell me the weather")
-        assert types == []
-
-    def test_case_insensitive_matching(self):
-        """Test that matching is case insensitive."""
-        assert "preference" in self._get_matching_types("WHAT DO THEY PREFER?")
-        assert "fact" in self._get_matching_types("FACTS ABOUT THEM")
+
+# memory.py is not imported: it is a CLI that delegates search to the bus
+# (bus.search, FTS5), so search safety is tested against a temporary bus.
+
+CHAT_ID = "+15555550001"
+INJECTION = "Robert'); DROP TABLE records; --"
+
+
+@pytest.fixture
+def search_bus(tmp_path):
+    """A bus on a temporary DB holding one message and one SDK event with INJECTION text."""
+    from bus.bus import Bus
+    bus = Bus(tmp_path / "bus.db")
+    bus.create_topic("messages", partitions=1)
+    producer = bus.producer()
+    producer.send("messages", key=CHAT_ID, value={"text": INJECTION},
+                  type="message.in", source="imessage")
+    producer.send_sdk_event("imessage/test", CHAT_ID, "tool_use", tool_name="Bash", payload=INJECTION)
+    assert producer.flush()
+    yield bus
+    bus.close()
+
+
+def _schema(bus) -> list:
+    """Every table, index and trigger definition in the bus DB."""
+    return bus._conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name").fetchall()
 
 
 class TestContactNameFormatting:
     """Tests for contact name formatting."""
 
-    def test_format_session_to_name(self):
+    @pytest.mark.parametrize("raw, expected", [
+        ("test-admin", "Test Admin"),
+        ("test", "Test"),
+        ("mary-jane-watson", "Mary Jane Watson"),
+    ])
+    def test_format_session_to_name(self, raw, expected):
         """Test converting session name to display name."""
         # This mirrors the logic in summary_for_session
-        contact = "test-admin"
-        name = contact.replace('-', ' ').title()
-        assert name == "Test Admin"
-
-    def test_format_single_name(self):
-        """Test single word name formatting."""
-        contact = "test"
-        name = contact.replace('-', ' ').title()
-        assert name == "Test"
-
-    def test_format_multi_part_name(self):
-        """Test multi-part name formatting."""
-        contact = "mary-jane-watson"
-        name = contact.replace('-', ' ').title()
-        assert name == "Mary Jane Watson"
+        assert raw.replace('-', ' ').title() == expected
 
 
 class TestMemorySummaryFormat:
@@ -112,21 +53,21 @@ class TestMemorySummaryFormat:
         name = "Test Admin"
         memories = ["Memory 1", "Memory 2", "Memory 3"]
 
-        lines = [
+        output = "\n".join([
             f"## About {name}",
             "",
             "What I know about them:",
-        ]
-        for mem in memories:
-            lines.append(f"- {mem}")
-
-        output = "\n".join(lines)
-
-        assert f"## About {name}" in output
-        assert "What I know about them:" in output
-        assert "- Memory 1" in output
-        assert "- Memory 2" in output
-        assert "- Memory 3" in output
+            *(f"- {mem}" for mem in memories),
+        ])
+
+        assert output == (
+            "## About Test Admin\n"
+            "\n"
+            "What I know about them:\n"
+            "- Memory 1\n"
+            "- Memory 2\n"
+            "- Memory 3"
+        )
 
     def test_summary_limits_memories(self):
         """Test that summary limits number of memories."""
@@ -140,14 +81,13 @@ class TestMemorySummaryFormat:
 class TestConsolidationDateFiltering:
     """Tests for consolidation date filtering logic."""
 
-    def test_date_prefix_matching(self):
-        """Test that date prefix matching works."""
-        from datetime import date
-        today = date.today().isoformat()  # "2026-01-24"
-
-        # Timestamp from today should match
-        ts_today = "2026-01-24T10:30:00"
-        assert ts_today.startswith(today) or not ts_today.startswith(today)  # Depends on actual date
+    @pytest.mark.parametrize("ts, day, expected", [
+        ("2026-01-24T10:30:00", "2026-01-24", True),
+        ("2026-01-23T23:59:59", "2026-01-24", False),
+    ])
+    def test_date_prefix_matching(self, ts, day, expected):
+        """Test that timestamps match only their own day's date prefix."""
+        assert ts.startswith(day) is expected
 
     def test_date_prefix_format(self):
         """Test date prefix format is correct."""
@@ -160,27 +100,31 @@ class TestConsolidationDateFiltering:
 
 
 class TestSqlInjectionSafety:
-    """Tests to verify SQL injection safety."""
+    """Tests to verify SQL injection safety of memory search (bus FTS5)."""
+
+    def test_injection_query_is_searched_as_text(self, search_bus):
+        """An injection-style query finds the stored text and leaves the schema alone."""
+        schema = _schema(search_bus)
+
+        query = "Robert'; DROP TABLE records; --"
+        records = search_bus.search(query)
+        events = search_bus.search_sdk(query, chat_id=CHAT_ID)
 
-    def test_parameterized_query_format(self):
-        """Test that queries use parameterized format."""
-        # These are example query patterns from memory.py
-        # They should use ? placeholders, not string formatting
+        assert [r.payload_text for r in records] == [INJECTION]
+        assert [e.payload_text for e in events] == [INJECTION]
+        assert _schema(search_bus) == schema
 
-        # Good pattern (from load_memories):
-        query = "SELECT id FROM memories WHERE contact = ?"
-        assert "?" in query
-        assert "%" not in query  # No string formatting
+    def test_injection_in_filters_does_not_widen_match(self, search_bus):
+        """Quotes in filter values can't break out of the FTS5 value or WHERE param."""
+        schema = _schema(search_bus)
 
-        # Good pattern (from search_memories):
-        query = "SELECT contact FROM memories WHERE memory_text ILIKE ?"
-        assert "?" in query
+        assert search_bus.search("Robert", key=CHAT_ID)
+        assert search_bus.search("Robert", key=f'{CHAT_ID}" OR key:"x') == []
+        assert search_bus.search_sdk("Robert", chat_id=f"{CHAT_ID}' OR '1'='1") == []
+        assert _schema(search_bus) == schema
 
     def test_quote_handling_in_text(self):
-        """Test that quotes in text don't break queries."""
-        # When saving memory, quotes should be handled by parameterization
+        """Test that quotes in text can't break out of an FTS5 value."""
+        search = importlib.import_module("bus.search")
         text_with_quotes = 'He said "hello" to me'
-        # Parameterized query handles this automatically
-        assert '"' in text_with_quotes  # Contains quotes
-        # The actual SQL would be: INSERT INTO ... VALUES (?, ?, ...)
-        # with text_with_quotes as a parameter - safe!
+        assert search._quote_fts_value(text_with_quotes) == '"He said ""hello"" to me"'
@@ -11,10 +11,10 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import tempfile
 import os
-import sys
 
-# Add prototypes to path for imports
-sys.path.insert(0, str(Path.home() / "dispatch/prototypes/memory-consolidation"))
+# Prototype dir (under the repo root) is put on sys.path by tests/unit/conftest.py
+import consolidate_3pass
+import consolidate_chat
 
 
 class TestConsolidate3Pass:
@@ -22,8 +22,6 @@ class TestConsolidate3Pass:
 
     def test_extract_json_from_output_with_markdown(self):
         """Should extract JSON from markdown code blocks."""
-        from consolidate_3pass import extract_json_from_output
-
         output = '''Here are the facts:
 
 ```json
@@ -35,82 +33,73 @@ class TestConsolidate3Pass:
 
 That's all.'''
 
-        result = extract_json_from_output(output)
+        result = consolidate_3pass.extract_json_from_output(output)
         assert len(result) == 2
         assert result[0]["fact"] == "Has a dog"
         assert result[1]["quote"] == "Boston winter"
 
     def test_extract_json_from_output_raw(self):
         """Should extract raw JSON without markdown."""
-        from consolidate_3pass import extract_json_from_output
-
         output = '[{"fact": "Plays tennis", "quote": "tennis match"}]'
-        result = extract_json_from_output(output)
+        result = consolidate_3pass.extract_json_from_output(output)
         assert len(result) == 1
         assert result[0]["fact"] == "Plays tennis"
 
+    def test_extract_json_from_output_skips_non_object_arrays(self):
+        """Should skip bracketed prose and return the array of objects."""
+        output = 'Found [1] candidate:\n[{"fact":"x"}]'
+        result = consolidate_3pass.extract_json_from_output(output)
+        assert result == [{"fact": "x"}]
+
+    def test_extract_json_from_output_bare_object(self):
+        """Should return a bare JSON object output as parsed."""
+        output = '{"fact": "Plays tennis"}'
+        result = consolidate_3pass.extract_json_from_output(output)
+        assert result == {"fact": "Plays tennis"}
+
     def test_extract_json_from_output_empty(self):
         """Should return empty list for invalid JSON."""
-        from consolidate_3pass import extract_json_from_output
-
         output = "No facts found in the messages."
-        result = extract_json_from_output(output)
+        result = consolidate_3pass.extract_json_from_output(output)
         assert result == []
 
     def test_is_excluded_match(self):
         """Should match exclusion patterns case-insensitively."""
-        from consolidate_3pass import is_excluded
-
-        exclusions = ["propose", "proposal", "engagement ring", "surprise party"]
+        exclusions = consolidate_3pass.compile_exclusions(["propose", "proposal", "engagement ring", "surprise party"])
 
-        assert is_excluded("Planning to propose to Partner User", exclusions) == True
-        assert is_excluded("Bought an ENGAGEMENT RING", exclusions) == True
-        assert is_excluded("Planning a proposal", exclusions) == True
-        assert is_excluded("Has a dog named Max", exclusions) == False
+        assert consolidate_3pass.is_excluded("Planning to propose to Partner User", exclusions) == True
+        assert consolidate_3pass.is_excluded("Bought an ENGAGEMENT RING", exclusions) == True
+        assert consolidate_3pass.is_excluded("Planning a proposal", exclusions) == True
+        assert consolidate_3pass.is_excluded("Has a dog named Max", exclusions) == False
 
     def test_is_excluded_empty_list(self):
         """Should return False with empty exclusions."""
-        from consolidate_3pass import is_excluded
-
-        assert is_excluded("Planning to propose", []) == False
+        assert consolidate_3pass.compile_exclusions([]) is None
+        assert consolidate_3pass.is_excluded("Planning to propose", consolidate_3pass.compile_exclusions([])) == False
 
-    def test_load_exclusions_file(self):
+    def test_load_exclusions_file(self, monkeypatch):
         """Should load exclusions from file, ignoring comments."""
-        from consolidate_3pass import load_exclusions, EXCLUSIONS_FILE
-
-        # Create temp exclusions file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("# Comment line\n")
-            f.write("proposal\n")
-            f.write("  engagement ring  \n")  # With whitespace
-            f.write("\n")  # Empty line
-            f.write("surprise\n")
-            temp_path = f.name
-
-        try:
-            with patch.object(sys.modules['consolidate_3pass'], 'EXCLUSIONS_FILE', Path(temp_path)):
-                from consolidate_3pass import load_exclusions
-                # Re-import to get patched version
-                import importlib
-                import consolidate_3pass
-                original = consolidate_3pass.EXCLUSIONS_FILE
-                consolidate_3pass.EXCLUSIONS_FILE = Path(temp_path)
-
-                result = consolidate_3pass.load_exclusions()
-
-                consolidate_3pass.EXCLUSIONS_FILE = original
-
-            assert "proposal" in result
-            assert "engagement ring" in result
-            assert "surprise" in result
-            assert len(result) == 3  # No comment or empty lines
-        finally:
-            os.unlink(temp_path)
+        # In-memory stand-in for the exclusions file
+        exclusions_file = MagicMock(spec=Path)
+        exclusions_file.exists.return_value = True
+        exclusions_file.read_text.return_value = (
+            "# Comment line\n"
+            "proposal\n"
+            "  engagement ring  \n"  # With whitespace
+            "\n"  # Empty line
+            "surprise\n"
+        )
+        monkeypatch.setattr(consolidate_3pass, "EXCLUSIONS_FILE", exclusions_file)
+
+        result = consolidate_3pass.load_exclusions()
+
+        assert "proposal" in result
+        assert "engagement ring" in result
+        assert "surprise" in result
+        assert len(result) == 3  # No comment or empty lines
 
     def test_parse_existing_memories(self):
         """Should parse bullet points from existing notes."""
-        from consolidate_3pass import parse_existing_memories
-
         notes = """<!-- CLAUDE-MANAGED:v1 -->
 ## About John
 - Has a dog named Max
@@ -123,17 +112,15 @@ Some manual notes here
 ---
 *Last updated: 2026-02-16 10:00*
 """
-        result = parse_existing_memories(notes)
+        result = consolidate_3pass.parse_existing_memories(notes)
         assert "- Has a dog named Max" in result
         assert "- Lives in Boston" in result
         assert "- Plays tennis" in result
 
     def test_parse_existing_memories_empty(self):
         """Should return (none) for empty notes."""
-        from consolidate_3pass import parse_existing_memories
-
-        assert parse_existing_memories("") == "(none)"
-        assert parse_existing_memories(None) == "(none)"
+        assert consolidate_3pass.parse_existing_memories("") == "(none)"
+        assert consolidate_3pass.parse_existing_memories(None) == "(none)"
 
 
 class TestConsolidateChat:
@@ -141,8 +128,6 @@ class TestConsolidateChat:
 
     def test_extract_json_from_output(self):
         """Should extract JSON object from agent output."""
-        from consolidate_chat import extract_json_from_output
-
         output = '''Based on my analysis:
 
 ```json
@@ -154,15 +139,13 @@ class TestConsolidateChat:
 }
 ```
 '''
-        result = extract_json_from_output(output)
+        result = consolidate_chat.extract_json_from_output(output)
         assert "ongoing" in result
         assert len(result["ongoing"]) == 1
         assert result["ongoing"][0]["item"] == "Planning trip"
 
     def test_prune_stale_items(self):
         """Should remove items older than stale_days."""
-        from consolidate_chat import prune_stale_items
-
         today = datetime.now().strftime("%Y-%m-%d")
         old_date = (datetime.now() - timedelta(days=20)).strftime("%Y-%m-%d")
         recent_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
@@ -174,7 +157,7 @@ class TestConsolidateChat:
             {"item": "No date task"},  # Should be kept
         ]
 
-        result = prune_stale_items(items, stale_days=14)
+        result = consolidate_chat.prune_stale_items(items, stale_days=14)
 
         assert len(result) == 3
         items_text = [i["item"] for i in result]
@@ -185,8 +168,6 @@ class TestConsolidateChat:
 
     def test_parse_existing_context(self):
         """Should parse CONTEXT.md into structured data."""
-        from consolidate_chat import parse_existing_context
-
         content = """<!-- CLAUDE-MANAGED:v1 -->
 ## Ongoing
 - Planning Maui trip [2026-02-10]
@@ -205,7 +186,7 @@ class TestConsolidateChat:
 ---
 *Last updated: 2026-02-16 10:00*
 """
-        result = parse_existing_context(content)
+        result = consolidate_chat.parse_existing_context(content)
 
         assert len(result["ongoing"]) == 2
         assert result["ongoing"][0]["item"] == "Planning Maui trip"
@@ -217,23 +198,19 @@ class TestConsolidateChat:
 
     def test_parse_existing_context_empty(self):
         """Should return empty lists for empty content."""
-        from consolidate_chat import parse_existing_context
-
-        result = parse_existing_context("")
+        result = consolidate_chat.parse_existing_context("")
         assert result == {"ongoing": [], "pending": [], "topics": [], "preferences": []}
 
     def test_format_context_md(self):
         """Should format items into valid CONTEXT.md."""
-        from consolidate_chat import format_context_md, MANAGED_HEADER
-
         ongoing = [{"item": "Task 1", "date": "2026-02-16"}]
         pending = [{"item": "Remind X"}]
         topics = [{"item": "Topic A"}, {"item": "Topic B"}]
         preferences = [{"item": "Short responses"}]
 
-        result = format_context_md(ongoing, pending, topics, preferences)
+        result = consolidate_chat.format_context_md(ongoing, pending, topics, preferences)
 
-        assert MANAGED_HEADER in result
+        assert consolidate_chat.MANAGED_HEADER in result
         assert "## Ongoing" in result
         assert "- Task 1 [2026-02-16]" in result
         assert "## Pending" in result
@@ -245,45 +222,38 @@ class TestConsolidateChat:
 
     def test_format_context_md_max_items(self):
         """Should limit items per section."""
-        from consolidate_chat import format_context_md
-
         # Create more than max items
         ongoing = [{"item": f"Task {i}", "date": "2026-02-16"} for i in range(10)]
 
-        result = format_context_md(ongoing, [], [], [])
+        result = consolidate_chat.format_context_md(ongoing, [], [], [])
 
         # Should have max 5 ongoing items
         assert result.count("- Task") == 5
 
     def test_is_group_chat(self):
         """Should detect group chats vs individual."""
-        from consolidate_chat import is_group_chat
+        assert consolidate_chat.is_group_chat("+15555550001") == False
+        assert consolidate_chat.is_group_chat("_15555550001") == False
+        assert consolidate_chat.is_group_chat("ab3876ca883949d2b0ce9c4cd5d1d633") == True
+        assert consolidate_chat.is_group_chat("b3d258b9a4de447ca412eb335c82a077") == True
 
-        assert is_group_chat("+15555550001") == False
-        assert is_group_chat("_15555550001") == False
-        assert is_group_chat("ab3876ca883949d2b0ce9c4cd5d1d633") == True
-        assert is_group_chat("b3d258b9a4de447ca412eb335c82a077") == True
-
-    def test_get_transcript_dir(self):
+    def test_get_transcript_dir(self, tmp_path):
         """Should find transcript directory for chat_id."""
-        from consolidate_chat import get_transcript_dir, TRANSCRIPTS_DIR
-
-        # Create temp transcript dir
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir) / "imessage" / "_15555550001"
-            test_dir.mkdir(parents=True)
-
-            with patch.object(sys.modules['consolidate_chat'], 'TRANSCRIPTS_DIR', Path(tmpdir)):
-                import consolidate_chat
-                original = consolidate_chat.TRANSCRIPTS_DIR
-                consolidate_chat.TRANSCRIPTS_DIR = Path(tmpdir)
+        test_dir = tmp_path / "imessage" / "_15555550001"
+        test_dir.mkdir(parents=True)
 
-                result = consolidate_chat.get_transcript_dir("+15555550001")
+        with patch.object(consolidate_chat, 'TRANSCRIPTS_DIR', tmp_path):
+            result = consolidate_chat.get_transcript_dir("+15555550001")
 
-                consolidate_chat.TRANSCRIPTS_DIR = original
+        assert result == test_dir
 
-            assert result is not None
-            assert result.exists()
+    def test_get_transcript_dir_finds_dir_created_after_miss(self, tmp_path):
+        """A miss must not hide a transcript dir created later."""
+        with patch.object(consolidate_chat, 'TRANSCRIPTS_DIR', tmp_path):
+            assert consolidate_chat.get_transcript_dir("+15555550002") is None
+            test_dir = tmp_path / "signal" / "_15555550002"
+            test_dir.mkdir(parents=True)
+            assert consolidate_chat.get_transcript_dir("+15555550002") == test_dir
 
 
 class TestFetchMessagesFromBus:
@@ -291,7 +261,6 @@ class TestFetchMessagesFromBus:
 
     def _make_mock_conn(self, rows):
         """Helper: create a mock sqlite3 connection returning given rows."""
-        from unittest.mock import MagicMock
         mock_conn = MagicMock()
         mock_conn.execute.return_value.fetchall.return_value = rows
         return mock_conn
@@ -300,13 +269,6 @@ class TestFetchMessagesFromBus:
         """Should handle messages where 'text' key exists but value is None (null JSON).
         This was the bug that caused the nightly consolidation to fail on 2026-03-30.
         """
-        import json
-        from unittest.mock import patch
-        from pathlib import Path
-        import sys
-        sys.path.insert(0, str(Path.home() / "dispatch/prototypes/memory-consolidation"))
-        from consolidate_chat import fetch_messages_from_bus
-
         rows = [
             (1700000000000, "message.received", json.dumps({"text": None, "sender": "+15555550001", "chat_id": "test"})),
             (1700000001000, "message.received", json.dumps({"text": "hello world", "sender": "+15555550001", "chat_id": "test"})),
@@ -324,7 +286,7 @@ class TestFetchMessagesFromBus:
                 mock_bus.exists.return_value = True
                 mock_bus.__str__ = MagicMock(return_value="/fake/bus.db")
 
-                result = fetch_messages_from_bus("test-chat-id", limit=10)
+                result = consolidate_chat.fetch_messages_from_bus("test-chat-id", limit=10)
 
         # null text row skipped, real messages included — should not crash
         assert "hello world" in result
@@ -332,13 +294,6 @@ class TestFetchMessagesFromBus:
 
     def test_missing_text_field_skipped(self):
         """Should skip messages with no 'text' key at all."""
-        import json
-        from unittest.mock import patch, MagicMock
-        from pathlib import Path
-        import sys
-        sys.path.insert(0, str(Path.home() / "dispatch/prototypes/memory-consolidation"))
-        from consolidate_chat import fetch_messages_from_bus
-
         rows = [
             (1700000000000, "message.received", json.dumps({"sender": "+15555550001", "chat_id": "test"})),
             (1700000001000, "message.received", json.dumps({"text": "real message", "sender": "+15555550001", "chat_id": "test"})),
@@ -352,19 +307,12 @@ class TestFetchMessagesFromBus:
 
         with patch("sqlite3.connect", return_value=mock_conn):
             with patch("consolidate_chat.DISPATCH_DIR", mock_bus):
-                result = fetch_messages_from_bus("test-chat-id", limit=10)
+                result = consolidate_chat.fetch_messages_from_bus("test-chat-id", limit=10)
 
         assert "real message" in result
 
     def test_empty_text_field_skipped(self):
         """Should skip messages with empty string text."""
-        import json
-        from unittest.mock import patch, MagicMock
-        from pathlib import Path
-        import sys
-        sys.path.insert(0, str(Path.home() / "dispatch/prototypes/memory-consolidation"))
-        from consolidate_chat import fetch_messages_from_bus
-
         rows = [
             (1700000000000, "message.received", json.dumps({"text": "", "sender": "+15555550001", "chat_id": "test"})),
             (1700000001000, "message.received", json.dumps({"text": "valid", "sender": "+15555550001", "chat_id": "test"})),
@@ -378,7 +326,7 @@ class TestFetchMessagesFromBus:
 
         with patch("sqlite3.connect", return_value=mock_conn):
             with patch("consolidate_chat.DISPATCH_DIR", mock_bus):
-                result = fetch_messages_from_bus("test-chat-id", limit=10)
+                result = consolidate_chat.fetch_messages_from_bus("test-chat-id", limit=10)
 
         assert "valid" in result
 
@@ -428,9 +376,7 @@ class TestExclusionFiltering:
 
     def test_proposal_excluded(self):
         """Should filter out proposal-related facts."""
-        from consolidate_3pass import is_excluded
-
-        exclusions = ["proposal", "propose", "engagement ring"]
+        exclusions = consolidate_3pass.compile_exclusions(["proposal", "propose", "engagement ring"])
 
         facts = [
             "Planning to propose on May 9th",
@@ -439,7 +385,7 @@ class TestExclusionFiltering:
             "Plays tennis",
         ]
 
-        filtered = [f for f in facts if not is_excluded(f, exclusions)]
+        filtered = [f for f in facts if not consolidate_3pass.is_excluded(f, exclusions)]
 
         assert len(filtered) == 2
         assert "Plays tennis" in filtered
@@ -447,13 +393,11 @@ class TestExclusionFiltering:
 
     def test_exclusion_case_insensitive(self):
         """Should match exclusions regardless of case."""
-        from consolidate_3pass import is_excluded
-
-        exclusions = ["proposal"]
+        exclusions = consolidate_3pass.compile_exclusions(["proposal"])
 
-        assert is_excluded("PROPOSAL plans", exclusions) == True
-        assert is_excluded("Proposal", exclusions) == True
-        assert is_excluded("proposal", exclusions) == True
+        assert consolidate_3pass.is_excluded("PROPOSAL plans", exclusions) == True
+        assert consolidate_3pass.is_excluded("Proposal", exclusions) == True
+        assert consolidate_3pass.is_excluded("proposal", exclusions) == True
 
 
 if __name__ == "__main__":
@@ -14,13 +14,19 @@ import pytest
 class TestChatStyleRaceCondition:
     """Tests for the chat_style NULL re-query fix."""
 
-    def setup_method(self):
-        """Create a temporary in-memory database for testing."""
-        self.conn = sqlite3.connect(':memory:')
-        self.cursor = self.conn.cursor()
-        
+    @classmethod
+    def setup_class(cls):
+        """Create an in-memory database with the schema once for the class."""
+        cls.conn = sqlite3.connect(':memory:')
+        cls.cursor = cls.conn.cursor()
+        # Throwaway DB: skip journaling and syncs entirely
+        cls.cursor.executescript('''
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA synchronous=OFF;
+        ''')
+
         # Create minimal schema
-        self.cursor.execute('''
+        cls.cursor.execute('''
             CREATE TABLE message (
                 ROWID INTEGER PRIMARY KEY,
                 date INTEGER,
@@ -33,13 +39,13 @@ class TestChatStyleRaceCondition:
                 thread_originator_guid TEXT
             )
         ''')
-        self.cursor.execute('''
+        cls.cursor.execute('''
             CREATE TABLE handle (
                 ROWID INTEGER PRIMARY KEY,
                 id TEXT
             )
         ''')
-        self.cursor.execute('''
+        cls.cursor.execute('''
             CREATE TABLE chat (
                 ROWID INTEGER PRIMARY KEY,
                 style INTEGER,
@@ -47,29 +53,49 @@ class TestChatStyleRaceCondition:
                 chat_identifier TEXT
             )
         ''')
-        self.cursor.execute('''
+        cls.cursor.execute('''
             CREATE TABLE chat_message_join (
                 message_id INTEGER,
                 chat_id INTEGER
             )
         ''')
-        self.conn.commit()
+        cls.conn.commit()
 
-    def teardown_method(self):
+    @classmethod
+    def teardown_class(cls):
         """Clean up database."""
-        self.conn.close()
+        cls.conn.close()
+
+    def setup_method(self):
+        """Reset rows left by the previous test; the schema is kept."""
+        self.cursor.executescript('''
+            DELETE FROM message;
+            DELETE FROM handle;
+            DELETE FROM chat;
+            DELETE FROM chat_message_join;
+        ''')
+
+    def _insert(self, handles=(), messages=(), chats=(), joins=()):
+        """Insert rows with one executemany per table and a single commit."""
+        self.cursor.executemany(
+            'INSERT INTO handle (ROWID, id) VALUES (?, ?)', handles)
+        self.cursor.executemany(
+            'INSERT INTO message (ROWID, date, text, handle_id) VALUES (?, ?, ?, ?)',
+            messages)
+        self.cursor.executemany(
+            'INSERT INTO chat (ROWID, style, display_name, chat_identifier) VALUES (?, ?, ?, ?)',
+            chats)
+        self.cursor.executemany(
+            'INSERT INTO chat_message_join (message_id, chat_id) VALUES (?, ?)', joins)
+        self.conn.commit()
 
     def test_null_chat_style_detected(self):
         """Verify that NULL chat_style is detected when join is missing."""
         # Insert message without join entry
-        self.cursor.execute('''
-            INSERT INTO handle (ROWID, id) VALUES (1, '+16175551234')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO message (ROWID, date, text, handle_id) 
-            VALUES (100, 791264348197529984, 'test message', 1)
-        ''')
-        self.conn.commit()
+        self._insert(
+            handles=[(1, '+16175551234')],
+            messages=[(100, 791264348197529984, 'test message', 1)],
+        )
         
         # Query without join - should get NULL chat_style
         self.cursor.execute('''
@@ -84,24 +110,12 @@ class TestChatStyleRaceCondition:
 
     def test_chat_style_populated_after_join(self):
         """Verify chat_style is populated once join exists."""
-        # Insert message
-        self.cursor.execute('''
-            INSERT INTO handle (ROWID, id) VALUES (1, '+16175551234')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO message (ROWID, date, text, handle_id) 
-            VALUES (100, 791264348197529984, 'test message', 1)
-        ''')
-        # Insert chat
-        self.cursor.execute('''
-            INSERT INTO chat (ROWID, style, display_name, chat_identifier) 
-            VALUES (1, 43, 'Test Group', 'abc123')
-        ''')
-        # Insert join
-        self.cursor.execute('''
-            INSERT INTO chat_message_join (message_id, chat_id) VALUES (100, 1)
-        ''')
-        self.conn.commit()
+        self._insert(
+            handles=[(1, '+16175551234')],
+            messages=[(100, 791264348197529984, 'test message', 1)],
+            chats=[(1, 43, 'Test Group', 'abc123')],
+            joins=[(100, 1)],
+        )
         
         # Query with join - should get chat_style=43
         self.cursor.execute('''
@@ -120,14 +134,10 @@ class TestChatStyleRaceCondition:
         # the join row appears between first query and re-query
         
         # First query returns NULL
-        self.cursor.execute('''
-            INSERT INTO handle (ROWID, id) VALUES (1, '+16175551234')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO message (ROWID, date, text, handle_id) 
-            VALUES (100, 791264348197529984, 'test group message', 1)
-        ''')
-        self.conn.commit()
+        self._insert(
+            handles=[(1, '+16175551234')],
+            messages=[(100, 791264348197529984, 'test group message', 1)],
+        )
         
         self.cursor.execute('''
             SELECT chat.style, chat.display_name, chat.chat_identifier
@@ -140,14 +150,10 @@ class TestChatStyleRaceCondition:
         assert first_result == (None, None, None), "First query should return NULLs"
         
         # Simulate join being written (what happens during the 50ms delay)
-        self.cursor.execute('''
-            INSERT INTO chat (ROWID, style, display_name, chat_identifier) 
-            VALUES (1, 43, 'Test Group', 'group-uuid-123')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO chat_message_join (message_id, chat_id) VALUES (100, 1)
-        ''')
-        self.conn.commit()
+        self._insert(
+            chats=[(1, 43, 'Test Group', 'group-uuid-123')],
+            joins=[(100, 1)],
+        )
         
         # Re-query should now return populated values
         self.cursor.execute('''
@@ -163,21 +169,12 @@ class TestChatStyleRaceCondition:
 
     def test_individual_chat_style(self):
         """Verify style=45 is correctly identified as individual (not group)."""
-        self.cursor.execute('''
-            INSERT INTO handle (ROWID, id) VALUES (1, '+16175551234')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO message (ROWID, date, text, handle_id) 
-            VALUES (100, 791264348197529984, 'direct message', 1)
-        ''')
-        self.cursor.execute('''
-            INSERT INTO chat (ROWID, style, display_name, chat_identifier) 
-            VALUES (1, 45, NULL, '+16175551234')
-        ''')
-        self.cursor.execute('''
-            INSERT INTO chat_message_join (message_id, chat_id) VALUES (100, 1)
-        ''')
-        self.conn.commit()
+        self._insert(
+            handles=[(1, '+16175551234')],
+            messages=[(100, 791264348197529984, 'direct message', 1)],
+            chats=[(1, 45, None, '+16175551234')],
+            joins=[(100, 1)],
+        )
         
         self.cursor.execute('''
             SELECT chat.style
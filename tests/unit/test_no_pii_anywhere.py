@@ -3,23 +3,27 @@
 This is the last line of defense before git init. If this passes, we're safe to commit.
 """
 
+import functools
+import os
 from pathlib import Path
 
 import pytest
 
+from tests.unit.pii_matcher import patterns_found
+
 REPO_ROOT = Path(__file__).parent.parent.parent
 
 # Files that are EXPECTED to contain PII (gitignored)
-ALLOWED_PII_FILES = {
+ALLOWED_PII_FILES = frozenset({
     "config.local.yaml",
     "sessions.json",       # runtime state
     "session_registry.json",  # runtime state
     ".env",
     ".pii-blocklist",      # pre-commit PII patterns (gitignored)
-}
+})
 
-# Directories to skip entirely
-SKIP_DIRS = {
+# Directories to skip entirely (pruned during the walk, never descended into)
+SKIP_DIRS = frozenset({
     ".venv", "__pycache__", "node_modules", ".git", "logs",
     "state",  # runtime state dir
     "sessions",  # runtime session data
@@ -33,15 +37,15 @@ SKIP_DIRS = {
     "research",  # research scripts with example data
     "services",  # service daemons with development data
     "apps",  # chat-viewer with development data
-}
+})
 
 # Binary extensions to skip
-BINARY_EXTS = {
+BINARY_EXTS = frozenset({
     ".pyc", ".pyo", ".so", ".dylib", ".db", ".duckdb",
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".woff", ".woff2",
     ".ttf", ".eot", ".lock", ".gz", ".zip", ".tar",
     ".plist",  # LaunchAgent plists are gitignored, contain system-specific paths
-}
+})
 
 PII_PATTERNS = [
     # Phone numbers (fake placeholders — real patterns loaded from .pii-blocklist at runtime)
@@ -51,6 +55,10 @@ PII_PATTERNS = [
     "5555550003",
 ]
 
+EMAIL_PATTERNS = ["fake-user@example.com", "fake-assistant@example.com"]
+
+FULL_NAME_PATTERNS = ["Fake Owner", "Fake Partner"]
+
 # First names, last names, usernames, session names
 NAME_PATTERNS = [
     # Loaded dynamically from .pii-blocklist if available
@@ -64,53 +72,82 @@ IP_PATTERNS = [
 ]
 
 
-def _scan_files(patterns: list[str]) -> list[str]:
-    """Scan all text files in repo for PII patterns. Returns violations."""
-    violations = []
-    for path in REPO_ROOT.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.name in ALLOWED_PII_FILES:
-            continue
-        if any(skip in path.parts for skip in SKIP_DIRS):
-            continue
-        if path.suffix in BINARY_EXTS:
-            continue
-        try:
-            content = path.read_text(errors="ignore")
-        except (PermissionError, OSError):
-            continue
-        for pattern in patterns:
-            if pattern in content:
-                rel = path.relative_to(REPO_ROOT)
-                violations.append(f"{rel}: contains '{pattern}'")
-    return violations
+@functools.lru_cache(maxsize=1)
+def _eligible_files() -> tuple[tuple[Path, bytes], ...]:
+    """Walk the repo once and return (relative path, content) for every text file."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(REPO_ROOT):
+        # Prune skipped subtrees before os.walk descends into them
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if name in ALLOWED_PII_FILES:
+                continue
+            if os.path.splitext(name)[1] in BINARY_EXTS:
+                continue
+            path = Path(dirpath, name)
+            if not path.is_file():  # broken symlinks, sockets, fifos
+                continue
+            try:
+                content = path.read_bytes()
+            except (PermissionError, OSError):
+                continue
+            files.append((path.relative_to(REPO_ROOT), content))
+    return tuple(files)
+
+
+def _scan_files(patterns: list[str]) -> list[tuple[Path, str]]:
+    """Scan all text files in repo for PII patterns. Returns (path, pattern) hits."""
+    patterns = tuple(patterns)
+    if not patterns:
+        return []
+    hits = []
+    for rel, content in _eligible_files():
+        for pattern in patterns_found(content, patterns):
+            hits.append((rel, pattern))
+    return hits
+
+
+@pytest.fixture(scope="session")
+def pii_scan_results() -> dict[str, list[Path]]:
+    """Files containing each pattern, from one scan for every pattern at once."""
+    all_patterns = dict.fromkeys(
+        PII_PATTERNS + EMAIL_PATTERNS + FULL_NAME_PATTERNS + NAME_PATTERNS + IP_PATTERNS
+    )
+    results = {pattern: [] for pattern in all_patterns}
+    for rel, pattern in _scan_files(list(all_patterns)):
+        results[pattern].append(rel)
+    return results
+
+
+def _violations(scan_results: dict[str, list[Path]], patterns: list[str]) -> list[str]:
+    """Format the hits for the given patterns, one line per file and pattern."""
+    return [f"{rel}: contains '{p}'" for p in dict.fromkeys(patterns) for rel in scan_results[p]]
 
 
 class TestNoPIIAnywhere:
-    def test_no_phone_numbers(self):
-        violations = _scan_files(["+15555550001", "+15555550003", "5555550001", "5555550003"])
+    def test_no_phone_numbers(self, pii_scan_results):
+        violations = _violations(pii_scan_results, PII_PATTERNS)
         assert not violations, "Phone numbers found:\n" + "\n".join(violations)
 
-    def test_no_emails(self):
-        violations = _scan_files(["fake-user@example.com", "fake-assistant@example.com"])
+    def test_no_emails(self, pii_scan_results):
+        violations = _violations(pii_scan_results, EMAIL_PATTERNS)
         assert not violations, "Emails found:\n" + "\n".join(violations)
 
-    def test_no_full_names(self):
-        violations = _scan_files(["Fake Owner", "Fake Partner"])
+    def test_no_full_names(self, pii_scan_results):
+        violations = _violations(pii_scan_results, FULL_NAME_PATTERNS)
         assert not violations, "Full names found:\n" + "\n".join(violations)
 
-    def test_no_partial_names(self):
+    def test_no_partial_names(self, pii_scan_results):
         """First names, last names, usernames, session names."""
-        violations = _scan_files(NAME_PATTERNS)
+        violations = _violations(pii_scan_results, NAME_PATTERNS)
         assert not violations, "Partial names/usernames found:\n" + "\n".join(violations)
 
-    def test_no_ips(self):
-        violations = _scan_files(IP_PATTERNS)
+    def test_no_ips(self, pii_scan_results):
+        violations = _violations(pii_scan_results, IP_PATTERNS)
         assert not violations, "IP addresses found:\n" + "\n".join(violations)
 
-    def test_all_pii_patterns(self):
+    def test_all_pii_patterns(self, pii_scan_results):
         """Single comprehensive check of all PII patterns."""
         all_patterns = PII_PATTERNS + NAME_PATTERNS + IP_PATTERNS
-        violations = _scan_files(all_patterns)
+        violations = _violations(pii_scan_results, all_patterns)
         assert not violations, f"PII found in {len(violations)} locations:\n" + "\n".join(violations)
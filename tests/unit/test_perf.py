@@ -2,7 +2,11 @@
 
 import asyncio
 import json
+import os
+import subprocess
+import sys
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -27,12 +31,7 @@ def read_perf_log(perf_dir: Path) -> list[dict]:
     log_file = perf_dir / f"perf-{datetime.now():%Y-%m-%d}.jsonl"
     if not log_file.exists():
         return []
-    entries = []
-    with open(log_file) as f:
-        for line in f:
-            if line.strip():
-                entries.append(json.loads(line))
-    return entries
+    return [json.loads(line) for line in log_file.read_bytes().splitlines() if line.strip()]
 
 
 class TestTiming:
@@ -47,6 +46,13 @@ class TestTiming:
         assert entries[0]["v"] == 1
         assert "ts" in entries[0]
 
+    def test_timing_ts_is_millisecond_iso(self, temp_perf_dir):
+        perf.timing("test_metric", 1.0)
+
+        ts = read_perf_log(temp_perf_dir)[0]["ts"]
+        assert abs((datetime.now() - datetime.fromisoformat(ts)).total_seconds()) < 5
+        assert len(ts.rpartition(".")[2]) == 3
+
     def test_timing_with_sampling(self, temp_perf_dir):
         # Log 10 calls with sample_rate=5
         for i in range(10):
@@ -54,7 +60,7 @@ class TestTiming:
 
         entries = read_perf_log(temp_perf_dir)
         # Should only log every 5th call (indices 4 and 9 since we start at 1)
-        assert len(entries) == 2
+        assert [e["value"] for e in entries] == [4.0, 9.0]
 
     def test_timing_sample_rate_1_logs_all(self, temp_perf_dir):
         for i in range(5):
@@ -90,6 +96,25 @@ class TestGauge:
         assert entries[0]["metric"] == "active_sessions"
         assert entries[0]["value"] == 7
 
+    def test_equal_label_values_of_different_types(self, temp_perf_dir):
+        # 1, True and 1.0 are equal dict keys; each must keep its own JSON form
+        for retry in (1, True, 1.0):
+            perf.gauge("active_sessions", 1, retry=retry)
+
+        entries = read_perf_log(temp_perf_dir)
+        assert [e["retry"] for e in entries] == [1, True, 1.0]
+        assert [type(e["retry"]) for e in entries] == [int, bool, float]
+
+    def test_nested_labels_recorded_as_logged(self, temp_perf_dir):
+        # The caller mutating its dict before the flush must not change the entry
+        tool_input = {"file_path": "/tmp/a.txt", "flags": ["-n"]}
+        perf.gauge("tool_input_size", 1, input=tool_input)
+        tool_input["file_path"] = "/tmp/b.txt"
+        tool_input["flags"].append("-v")
+
+        entries = read_perf_log(temp_perf_dir)
+        assert entries[0]["input"] == {"file_path": "/tmp/a.txt", "flags": ["-n"]}
+
 
 class TestTimedContextManager:
     def test_timed_context_logs_duration(self, temp_perf_dir):
@@ -163,6 +188,13 @@ class TestError:
         assert entries[0]["error_type"] == "contact_lookup_failed"
         assert entries[0]["value"] == 1
 
+    def test_repeated_errors_log_one_line_each(self, temp_perf_dir):
+        for _ in range(3):
+            perf.error("network_timeout", component="daemon")
+
+        entries = read_perf_log(temp_perf_dir)
+        assert [(e["error_type"], e["value"]) for e in entries] == [("network_timeout", 1)] * 3
+
 
 class TestGracefulDegradation:
     def test_write_failure_does_not_raise(self, temp_perf_dir):
@@ -171,6 +203,14 @@ class TestGracefulDegradation:
             # Should not raise, just log to stderr
             perf.timing("test", 1.0)
 
+    def test_unserializable_entry_dropped(self, temp_perf_dir):
+        # Serialization happens at flush; one bad entry must not sink the batch
+        perf.gauge("bad", 1, component=object())
+        perf.gauge("good", 2, component="test")
+
+        entries = read_perf_log(temp_perf_dir)
+        assert [e["metric"] for e in entries] == ["good"]
+
     def test_file_size_limit(self, temp_perf_dir):
         # Create a file that's already at the limit
         log_file = temp_perf_dir / f"perf-{datetime.now():%Y-%m-%d}.jsonl"
@@ -178,13 +218,74 @@ class TestGracefulDegradation:
             # Write more than MAX_FILE_SIZE_MB worth of data
             f.write("x" * (perf.MAX_FILE_SIZE_MB * 1024 * 1024 + 1))
 
-        # This should skip logging
+        # This should rotate the full file aside, not drop the entry
         perf.timing("test", 1.0)
 
-        # File should still be at original size (no append)
-        content = log_file.read_text()
-        assert content.startswith("x" * 100)  # Still contains our dummy data
-        assert '"metric"' not in content  # No new entry added
+        entries = read_perf_log(temp_perf_dir)
+        assert [e["metric"] for e in entries] == ["test"]
+        rotated = log_file.with_suffix(".1.jsonl").read_text()
+        assert rotated.startswith("x" * 100)  # Still contains our dummy data
+        assert '"metric"' not in rotated  # No new entry added
+
+    def test_rotates_when_write_crosses_limit(self, temp_perf_dir):
+        log_file = temp_perf_dir / f"perf-{datetime.now():%Y-%m-%d}.jsonl"
+        with patch.object(perf, "MAX_FILE_SIZE_MB", 50 / (1024 * 1024)):  # < one entry
+            perf.timing("first", 1.0)
+            perf.flush_metrics()
+            perf.timing("second", 2.0)
+            perf.flush_metrics()
+            perf.timing("third", 3.0)
+
+        entries = read_perf_log(temp_perf_dir)
+        assert [e["metric"] for e in entries] == ["third"]
+        assert "first" in log_file.with_suffix(".1.jsonl").read_text()
+        assert "second" in log_file.with_suffix(".2.jsonl").read_text()
+
+    def test_rotation_counts_other_writers(self, temp_perf_dir):
+        # dispatch-api appends to the same file between our flushes
+        log_file = temp_perf_dir / f"perf-{datetime.now():%Y-%m-%d}.jsonl"
+        with patch.object(perf, "MAX_FILE_SIZE_MB", 200 / (1024 * 1024)):
+            perf.timing("first", 1.0)
+            perf.flush_metrics()
+            with open(log_file, "a") as f:
+                f.write('{"metric": "api", "value": 1}\n' * 8)
+            perf.timing("second", 2.0)
+            perf.flush_metrics()
+            perf.timing("third", 3.0)
+
+        entries = read_perf_log(temp_perf_dir)
+        assert [e["metric"] for e in entries] == ["third"]
+        assert "second" in log_file.with_suffix(".1.jsonl").read_text()
+
+    def test_prune_old_logs(self, temp_perf_dir):
+        old_log = temp_perf_dir / "perf-2020-01-01.1.jsonl"
+        new_log = temp_perf_dir / f"perf-{datetime.now():%Y-%m-%d}.jsonl"
+        old_log.write_text("{}\n")
+        new_log.write_text("{}\n")
+        old_mtime = time.time() - (perf.RETENTION_DAYS + 1) * 86400
+        os.utime(old_log, (old_mtime, old_mtime))
+
+        perf._prune_old_logs(temp_perf_dir)
+
+        assert not old_log.exists()
+        assert new_log.exists()
+
+
+class TestDisabled:
+    def test_perf_enabled_0_makes_recording_a_noop(self, tmp_path):
+        script = (
+            "from pathlib import Path\n"
+            "from assistant import perf\n"
+            f"perf.PERF_DIR = Path({str(tmp_path)!r})\n"
+            "perf.timing('t', 1.0); perf.incr('c'); perf.error('e')\n"
+            "with perf.timed('block_ms'): pass\n"
+            "assert perf.timed_fn('fn_ms')(len)('ab') == 2\n"
+            "perf.flush_metrics()\n"
+        )
+        env = {**os.environ, "PERF_ENABLED": "0"}
+        repo_root = Path(__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", script], env=env, cwd=repo_root, check=True)
+        assert list(tmp_path.iterdir()) == []
 
 
 class TestIntegration:
@@ -1,12 +1,8 @@
 """Tests for poll_due.py - reminder polling and tag parsing."""
 import pytest
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add skills path
-sys.path.insert(0, str(Path.home() / ".claude/skills/reminders/scripts"))
-
+# Reminders scripts dir is put on sys.path by tests/unit/conftest.py
 from poll_due import (
     parse_tags_from_notes,
     extract_contact_from_list,
@@ -94,6 +90,28 @@ class TestParseTagsFromNotes:
 
         assert result["notes"] == "Task description"
 
+    def test_parse_invalid_target_kept(self):
+        """An invalid target tag is left in the notes when no valid one exists."""
+        result = parse_tags_from_notes("[target:xyz] hello")
+
+        assert result["target"] == "fg"
+        assert result["notes"] == "[target:xyz] hello"
+
+    def test_parse_mixed_case_target_kept(self):
+        """Target values are case-sensitive; [target:BG] is not a valid tag."""
+        result = parse_tags_from_notes("[target:BG] [cron:0 9 * * *] hello")
+
+        assert result["target"] == "fg"
+        assert result["cron"] == "0 9 * * *"
+        assert result["notes"] == "[target:BG] hello"
+
+    def test_parse_invalid_target_stripped_with_valid_one(self):
+        """Once a valid target is found, every target tag is stripped."""
+        result = parse_tags_from_notes("[target:xyz] [target:bg] hello")
+
+        assert result["target"] == "bg"
+        assert result["notes"] == "hello"
+
 
 class TestExtractContactFromList:
     """Tests for extract_contact_from_list function."""
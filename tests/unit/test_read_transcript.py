@@ -1,18 +1,14 @@
 """Tests for read_transcript.py - transcript extraction logic."""
+import json
 import pytest
-import sys
-from pathlib import Path
 
-# Add skills path
-sys.path.insert(0, str(Path.home() / ".claude/skills/sms-assistant/scripts"))
-
-from read_transcript import extract_sms_from_prompt, session_to_contact_name
+# read_transcript is provided by the session-scoped fixture in conftest.py
 
 
 class TestExtractSmsFromPrompt:
     """Tests for extract_sms_from_prompt function."""
 
-    def test_extract_simple_sms(self):
+    def test_extract_simple_sms(self, read_transcript):
         """Test extracting simple SMS content."""
         text = """
 ---SMS FROM Test Admin (admin)---
@@ -22,10 +18,10 @@ Hello world!
 
 Please respond...
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert result == "Chat ID: +15555550001\nHello world!"
 
-    def test_extract_multiline_sms(self):
+    def test_extract_multiline_sms(self, read_transcript):
         """Test extracting multi-line SMS content."""
         text = """
 ---SMS FROM Test User (favorite)---
@@ -35,46 +31,55 @@ Line two
 Line three
 ---END SMS---
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert "Line one" in result
         assert "Line two" in result
         assert "Line three" in result
 
-    def test_extract_no_markers_returns_none(self):
+    def test_extract_no_markers_returns_none(self, read_transcript):
         """Test that missing markers returns None."""
         text = "Just some regular text without markers"
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert result is None
 
-    def test_extract_only_start_marker_returns_none(self):
+    def test_extract_only_start_marker_returns_none(self, read_transcript):
         """Test that only start marker returns None."""
         text = """
 ---SMS FROM Test (admin)---
 Hello world
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert result is None
 
-    def test_extract_only_end_marker_returns_none(self):
+    def test_extract_only_end_marker_returns_none(self, read_transcript):
         """Test that only end marker returns None."""
         text = """
 Hello world
 ---END SMS---
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert result is None
 
-    def test_extract_empty_content(self):
+    def test_extract_empty_content(self, read_transcript):
         """Test extracting empty SMS content."""
         text = """
 ---SMS FROM Test (admin)---
 
 ---END SMS---
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
+        assert result == ""
+
+    def test_extract_empty_body_stops_at_own_end_marker(self, read_transcript):
+        """Test that an empty SMS doesn't run into the next message."""
+        text = (
+            "---SMS FROM A (admin)---\n---END SMS---\n"
+            "---SMS FROM B (admin)---\nhello\n---END SMS---\n"
+        )
+        result = read_transcript.extract_sms_from_prompt(text)
         assert result == ""
 
-    def test_extract_with_attachments(self):
+    def test_extract_with_attachments(self, read_transcript):
         """Test extracting SMS with attachment info."""
         text = """
 ---SMS FROM Test (admin)---
@@ -88,7 +93,7 @@ ATTACHMENTS:
 You can view images using the Read tool on the path above.
 ---END SMS---
 """
-        result = extract_sms_from_prompt(text)
+        result = read_transcript.extract_sms_from_prompt(text)
         assert "Check this out" in result
         assert "ATTACHMENTS" in result
 
@@ -96,30 +101,16 @@ You can view images using the Read tool on the path above.
 class TestSessionToContactName:
     """Tests for session_to_contact_name function."""
 
-    def test_simple_name(self):
-        """Test converting simple session name."""
-        result = session_to_contact_name("test-admin")
-        assert result == "Test Admin"
-
-    def test_single_name(self):
-        """Test converting single word session name."""
-        result = session_to_contact_name("test")
-        assert result == "Test"
-
-    def test_multiple_hyphens(self):
-        """Test converting session name with multiple hyphens."""
-        result = session_to_contact_name("mary-jane-watson")
-        assert result == "Mary Jane Watson"
-
-    def test_already_titlecase(self):
-        """Test session name that's already titlecase."""
-        result = session_to_contact_name("Test-Admin")
-        assert result == "Test Admin"
-
-    def test_all_lowercase(self):
-        """Test fully lowercase session name."""
-        result = session_to_contact_name("john-doe")
-        assert result == "John Doe"
+    @pytest.mark.parametrize("session_name,expected", [
+        ("test-admin", "Test Admin"),
+        ("test", "Test"),
+        ("mary-jane-watson", "Mary Jane Watson"),
+        ("Test-Admin", "Test Admin"),
+        ("john-doe", "John Doe"),
+    ])
+    def test_session_to_contact_name(self, read_transcript, session_name, expected):
+        """Test converting hyphenated session names to title-cased contact names."""
+        assert read_transcript.session_to_contact_name(session_name) == expected
 
 
 class TestExtractContextFiltering:
@@ -147,6 +138,27 @@ class TestExtractContextFiltering:
         separator = "=" * 60
         assert "===" in separator  # Would be filtered
 
+    def test_extract_context_filters_noisy_results(self, read_transcript, tmp_path):
+        """Test that extract_context keeps only meaningful tool results."""
+        results = [
+            "SENT|+1234567890|Hello there, this is long enough",
+            "Exit code: 1 and some more output after it",
+            "ok",
+            "=" * 60,
+            "Found 3 matching reminders for tomorrow",
+        ]
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text("".join(
+            json.dumps({
+                "type": "user",
+                "timestamp": "2026-01-01T00:00:00",
+                "message": {"content": [{"type": "tool_result", "content": r}]},
+            }) + "\n"
+            for r in results
+        ))
+        entries = read_transcript.extract_context(transcript)
+        assert entries == ["[2026-01-01T00:00:00] RESULT: Found 3 matching reminders for tomorrow"]
+
 
 class TestGroupSmsExtraction:
     """Tests for group SMS extraction."""
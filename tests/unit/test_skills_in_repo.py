@@ -1,22 +1,73 @@
 """Tests that skills are properly located in the repo and symlinked."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 
+from tests.unit.paths import SKILLS as HOME_SKILLS
+from tests.unit.pii_matcher import patterns_found
 
 REPO_ROOT = Path(__file__).parent.parent.parent
 SKILLS_DIR = REPO_ROOT / "skills"
-HOME_SKILLS = Path.home() / ".claude" / "skills"
+
+# Threads for reading skill files (I/O-bound; reads release the GIL)
+READ_WORKERS = 8
+
+# Never hold skills or skill docs; pruned from the SKILL.md walk
+WALK_SKIP_DIRS = frozenset({"__pycache__", "node_modules", ".venv", ".git"})
+
+PII_PATTERNS = (
+    "+15555550001", "+15555550003",
+    "fake-user@example.com", "fake-assistant@example.com",
+    "Eastburn",
+)
+
+
+@dataclass(frozen=True)
+class SkillsIndex:
+    dirs: tuple[Path, ...]  # top-level skill dirs (minus __pycache__)
+    skill_md: dict[Path, bytes]  # every SKILL.md under SKILLS_DIR
+    scripts: dict[Path, bytes]  # files directly inside */scripts
+
+
+@pytest.fixture(scope="session")
+def skills_index() -> SkillsIndex:
+    """Walk SKILLS_DIR once and read every SKILL.md and script for all tests.
+
+    The walk only collects paths; the files are then read on a thread pool.
+    """
+    with os.scandir(SKILLS_DIR) as entries:
+        dirs = tuple(Path(e.path) for e in entries if e.is_dir() and e.name != "__pycache__")
+    # os.walk doesn't follow symlinks, so each top-level skill's own SKILL.md
+    # is checked directly (symlinked skills included, as dirs above are)
+    skill_md_paths = [d / "SKILL.md" for d in dirs if (d / "SKILL.md").is_file()]
+    for root, subdirs, files in os.walk(SKILLS_DIR):
+        subdirs[:] = [d for d in subdirs if d not in WALK_SKIP_DIRS]
+        if "SKILL.md" in files:
+            skill_md_paths.append(Path(root) / "SKILL.md")
+    skill_md_paths = list(dict.fromkeys(skill_md_paths))
+    script_paths = []
+    for d in dirs:
+        try:
+            with os.scandir(d / "scripts") as entries:
+                script_paths.extend(Path(e.path) for e in entries if e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        skill_md = dict(zip(skill_md_paths, pool.map(Path.read_bytes, skill_md_paths)))
+        scripts = dict(zip(script_paths, pool.map(Path.read_bytes, script_paths)))
+    return SkillsIndex(dirs=dirs, skill_md=skill_md, scripts=scripts)
 
 
 class TestSkillsInRepo:
     def test_skills_dir_exists(self):
         assert SKILLS_DIR.exists(), "skills/ directory must exist in repo"
 
-    def test_skills_dir_has_skills(self):
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir() and d.name != "__pycache__"]
+    def test_skills_dir_has_skills(self, skills_index):
+        skill_dirs = skills_index.dirs
         assert len(skill_dirs) >= 10, f"Expected 10+ skills, found {len(skill_dirs)}"
 
     def test_home_skills_is_symlink(self):
@@ -27,14 +78,14 @@ class TestSkillsInRepo:
         expected = SKILLS_DIR.resolve()
         assert target == expected, f"Symlink points to {target}, expected {expected}"
 
-    def test_each_skill_has_skill_md(self):
+    def test_each_skill_has_skill_md(self, skills_index):
         """Every skill directory should have a SKILL.md."""
         # Get gitignored skill dirs to exclude
         import subprocess
         gitignored = set()
         try:
             result = subprocess.run(
-                ["git", "check-ignore"] + [str(d) for d in SKILLS_DIR.iterdir() if d.is_dir()],
+                ["git", "check-ignore"] + [str(d) for d in skills_index.dirs],
                 capture_output=True, text=True, cwd=SKILLS_DIR.parent
             )
             for line in result.stdout.strip().split("\n"):
@@ -42,65 +93,49 @@ class TestSkillsInRepo:
                     gitignored.add(Path(line).name)
         except Exception:
             pass
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir() and d.name not in ("__pycache__", "_lib") and d.name not in gitignored]
+        skill_dirs = [d for d in skills_index.dirs if d.name != "_lib" and d.name not in gitignored]
         missing = []
         for d in skill_dirs:
-            if not (d / "SKILL.md").exists():
+            if d / "SKILL.md" not in skills_index.skill_md:
                 missing.append(d.name)
         assert not missing, f"Skills missing SKILL.md: {missing}"
 
-    def test_skill_md_has_frontmatter(self):
+    def test_skill_md_has_frontmatter(self, skills_index):
         """Every SKILL.md should have YAML frontmatter with name and description."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir() and d.name not in ("__pycache__", "_lib")]
+        skill_dirs = [d for d in skills_index.dirs if d.name != "_lib"]
         bad = []
         for d in skill_dirs:
-            skill_md = d / "SKILL.md"
-            if skill_md.exists():
-                content = skill_md.read_text()
-                if not content.startswith("---"):
-                    bad.append(d.name)
+            content = skills_index.skill_md.get(d / "SKILL.md")
+            if content is not None and content[:3] != b"---":
+                bad.append(d.name)
         assert not bad, f"Skills with SKILL.md missing frontmatter: {bad}"
 
-    def test_expected_skills_present(self):
+    def test_expected_skills_present(self, skills_index):
         """Core skills that should always exist."""
         expected = [
             "sms-assistant", "chrome-control", "hue", "lutron", "sonos",
             "contacts", "memory", "podcast", "tts",
         ]
+        present = {d.name for d in skills_index.dirs}
         for name in expected:
-            assert (SKILLS_DIR / name).is_dir(), f"Expected skill {name} not found"
+            assert name in present, f"Expected skill {name} not found"
 
 
 class TestSkillsNoPII:
     """Skills should not contain hardcoded PII."""
 
-    PII_PATTERNS = [
-        "+15555550001", "+15555550003",
-        "fake-user@example.com", "fake-assistant@example.com",
-        "Eastburn",
-    ]
-
-    def test_skill_md_files_no_pii(self):
+    def test_skill_md_files_no_pii(self, skills_index):
         """No SKILL.md should contain hardcoded PII."""
         violations = []
-        for skill_md in SKILLS_DIR.rglob("SKILL.md"):
-            content = skill_md.read_text()
-            for pattern in self.PII_PATTERNS:
-                if pattern in content:
-                    violations.append(f"{skill_md.relative_to(SKILLS_DIR)}: {pattern}")
+        for skill_md, content in skills_index.skill_md.items():
+            for pattern in patterns_found(content, PII_PATTERNS):
+                violations.append(f"{skill_md.relative_to(SKILLS_DIR)}: {pattern}")
         assert not violations, f"PII found in SKILL.md files:\n" + "\n".join(violations)
 
-    def test_skill_scripts_no_pii(self):
+    def test_skill_scripts_no_pii(self, skills_index):
         """No skill script should contain hardcoded PII."""
         violations = []
-        for scripts_dir in SKILLS_DIR.glob("*/scripts"):
-            for script in scripts_dir.iterdir():
-                if script.is_file():
-                    try:
-                        content = script.read_text()
-                    except UnicodeDecodeError:
-                        continue
-                    for pattern in self.PII_PATTERNS:
-                        if pattern in content:
-                            violations.append(f"{script.relative_to(SKILLS_DIR)}: {pattern}")
+        for script, content in skills_index.scripts.items():
+            for pattern in patterns_found(content, PII_PATTERNS):
+                violations.append(f"{script.relative_to(SKILLS_DIR)}: {pattern}")
         assert not violations, f"PII found in skill scripts:\n" + "\n".join(violations)